@@ -0,0 +1,240 @@
+"""Archive old contact messages into compressed segments and apply retention.
+
+Archiving is opt-in: with PORTFOLIO_ARCHIVE_AFTER_DAYS (and
+PORTFOLIO_RETENTION_DAYS) unset, every message stays in the live database and
+no compactor runs. When enabled, a background compactor moves messages out of
+the live database into sealed segments under data/archive/: gzip compressed
+JSON Lines files named messages-YYYY-MM-NNN.jsonl.gz. A calendar month is
+sealed once all of it is older than PORTFOLIO_ARCHIVE_AFTER_DAYS, into one
+segment, or several when it
+holds more than PORTFOLIO_ARCHIVE_SEGMENT_MESSAGES messages. Sealed segments
+are never rewritten. With PORTFOLIO_RETENTION_DAYS set, older messages are
+deleted instead of archived, and segments whose month has passed out of
+retention are removed. The live tables, their indexes and the write-ahead log therefore only
+hold recent messages, however long the site has been running.
+
+Messages whose email notification is still pending or dead-lettered stay live
+until the outbox is done with them; one that becomes archivable after its
+month was sealed goes into a further segment of that month. Archived messages
+leave the inbox but are still included in exports (see iter_messages).
+
+Sealing is two-phase. The segment is written as a .tmp file, then the
+messages are deleted in the same transaction that records the segment as
+sealed, and only then is the file renamed. After a crash, a recorded .tmp
+file is renamed and an unrecorded one is discarded, so no message ends up in
+both the database and a segment.
+"""
+import gzip
+import json
+import logging
+import os
+import re
+import threading
+import time
+
+from message_store import DATA_DIR, message_store
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_DIR = DATA_DIR / "archive"
+# Messages older than this many days are archived (0, the default, disables archiving)
+ARCHIVE_AFTER_DAYS = float(os.getenv("PORTFOLIO_ARCHIVE_AFTER_DAYS", "0"))
+# Messages and segments older than this many days are deleted (0 keeps everything)
+RETENTION_DAYS = float(os.getenv("PORTFOLIO_RETENTION_DAYS", "0"))
+SEGMENT_MAX_MESSAGES = int(os.getenv("PORTFOLIO_ARCHIVE_SEGMENT_MESSAGES", "10000"))
+COMPACT_INTERVAL_SECONDS = float(os.getenv("PORTFOLIO_COMPACT_SECONDS", "3600"))
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+SEGMENT_PATTERN = re.compile(r"^messages-(\d{4}-\d{2})-(\d+)\.jsonl\.gz$")
+
+
+# Function to find the month a message is archived under
+def segment_month(timestamp):
+    """Return "YYYY-MM" for a message timestamp, or "0000-00" if it has none"""
+    month = timestamp[:7]
+    return month if re.match(r"^\d{4}-\d{2}$", month) else "0000-00"
+
+
+# Function to list the sealed segments
+def segments(archive_dir=ARCHIVE_DIR):
+    """Return [(month, path)] for every segment, oldest first"""
+    if not archive_dir.is_dir():
+        return []
+    found = []
+    for path in archive_dir.iterdir():
+        match = SEGMENT_PATTERN.match(path.name)
+        if match:
+            found.append((match.group(1), int(match.group(2)), path))
+    return [(month, path) for month, _, path in sorted(found)]
+
+
+# Function to read archived and live messages together
+def iter_messages(since=None, until=None, chunk_size=1000, store=message_store, archive_dir=ARCHIVE_DIR):
+    """Yield lists of up to chunk_size messages, archived ones first, then the live ones
+
+    since and until are inclusive "%Y-%m-%d %H:%M:%S" bounds. Segments outside
+    the range are skipped by name, and each is read one line at a time.
+    """
+    chunk = []
+    for month, path in segments(archive_dir):
+        if since is not None and month < since[:7] or until is not None and month > until[:7]:
+            continue
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            for line in f:
+                message = json.loads(line)
+                if since is not None and message["timestamp"] < since:
+                    continue
+                if until is not None and message["timestamp"] > until:
+                    continue
+                chunk.append(message)
+                if len(chunk) == chunk_size:
+                    yield chunk
+                    chunk = []
+    if chunk:
+        yield chunk
+    yield from store.iter_messages(since, until, chunk_size)
+
+
+class Compactor(threading.Thread):
+    """Daemon thread that seals old messages into segments and applies retention"""
+
+    def __init__(self, store=message_store, archive_dir=ARCHIVE_DIR, archive_after_days=ARCHIVE_AFTER_DAYS,
+                 retention_days=RETENTION_DAYS, segment_max=SEGMENT_MAX_MESSAGES,
+                 interval=COMPACT_INTERVAL_SECONDS):
+        super().__init__(name="archive-compactor", daemon=True)
+        self.store = store
+        self.archive_dir = archive_dir
+        self.archive_after_days = archive_after_days
+        self.retention_days = retention_days
+        self.segment_max = segment_max
+        self.interval = interval
+        self._stopping = threading.Event()
+        self._compact_lock = threading.Lock()
+        self.runs = 0
+        self.last_run = None
+
+    def stop(self):
+        self._stopping.set()
+
+    def run(self):
+        while not self._stopping.is_set():
+            try:
+                self.compact()
+            except Exception:
+                logger.exception("Archive compaction failed")
+            self._stopping.wait(self.interval)
+
+    def compact(self, now=None):
+        """Archive and expire what is due now; returns a summary of the run"""
+        now = time.time() if now is None else now
+        started = time.perf_counter()
+        result = {"archived": 0, "segments_written": 0, "expired_messages": 0, "expired_segments": 0}
+        archive_before = retention_before = None
+        if self.archive_after_days > 0:
+            archive_before = time.strftime(TIMESTAMP_FORMAT, time.localtime(now - self.archive_after_days * 86400))
+        if self.retention_days > 0:
+            retention_before = time.strftime(TIMESTAMP_FORMAT, time.localtime(now - self.retention_days * 86400))
+        if archive_before:
+            # Only whole months are archived, so each month is sealed in one go
+            archive_before = archive_before[:7] + "-01 00:00:00"
+        # Everything older than either cutoff leaves the live tables
+        before = max(filter(None, (archive_before, retention_before)), default=None)
+
+        with self._compact_lock:
+            self._recover()
+            if before:
+                self._seal(before, retention_before, result)
+            if retention_before:
+                for month, path in segments(self.archive_dir):
+                    # A month is only dropped once every message in it is out of retention
+                    if month < retention_before[:7]:
+                        path.unlink(missing_ok=True)
+                        result["expired_segments"] += 1
+            if result["archived"] or result["expired_messages"]:
+                self.store.checkpoint()
+            result["seconds"] = time.perf_counter() - started
+            self.runs += 1
+            self.last_run = result
+        if result["archived"] or result["expired_messages"] or result["expired_segments"]:
+            logger.info("Archive compaction: %s", json.dumps(result))
+        return result
+
+    def _recover(self):
+        """Finish or discard segments left half-written by an interrupted run"""
+        if not self.archive_dir.is_dir():
+            return
+        for tmp_path in self.archive_dir.glob("messages-*.jsonl.gz.tmp"):
+            path = tmp_path.with_name(tmp_path.name[:-len(".tmp")])
+            if self.store.segment_sealed(path.name):
+                os.replace(tmp_path, path)
+            else:
+                tmp_path.unlink()
+
+    def _seal(self, before, retention_before, result):
+        """Move messages stored before `before` into segments, deleting those out of retention"""
+        while True:
+            rows = self.store.archivable_messages(before, self.segment_max)
+            if not rows:
+                return
+            if retention_before and rows[0]["timestamp"] < retention_before:
+                expired = [row["id"] for row in rows if row["timestamp"] < retention_before]
+                self.store.remove_messages(expired)
+                result["expired_messages"] += len(expired)
+                continue
+            # Rows come in timestamp order, so one month is a prefix of the batch
+            month = segment_month(rows[0]["timestamp"])
+            batch = [row for row in rows if segment_month(row["timestamp"]) == month]
+            self._write_segment(month, batch)
+            result["archived"] += len(batch)
+            result["segments_written"] += 1
+
+    def _write_segment(self, month, rows):
+        """Seal rows as the next segment of month and remove them from the live tables"""
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        part = 1 + max((int(SEGMENT_PATTERN.match(path.name).group(2))
+                        for found_month, path in segments(self.archive_dir) if found_month == month), default=0)
+        path = self.archive_dir / f"messages-{month}-{part:03d}.jsonl.gz"
+        tmp_path = path.with_name(path.name + ".tmp")
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            for row in rows:
+                f.write(json.dumps({**row, "read": bool(row["read"])}, ensure_ascii=False) + "\n")
+        with open(tmp_path, "rb") as f:
+            os.fsync(f.fileno())
+        self.store.remove_messages([row["id"] for row in rows], sealed_segment=path.name)
+        os.replace(tmp_path, path)
+
+    def stats(self):
+        """Return the segment count and size, and a summary of the last run"""
+        found = segments(self.archive_dir)
+        return {
+            "archive_after_days": self.archive_after_days,
+            "retention_days": self.retention_days,
+            "segments": len(found),
+            "segment_bytes": sum(path.stat().st_size for _, path in found),
+            "runs": self.runs,
+            "last_run": self.last_run,
+        }
+
+
+_compactor = None
+_compactor_lock = threading.Lock()
+
+
+# Function to start the compactor once per process
+def start():
+    """Start the background compactor unless it is running or neither archiving nor retention is enabled"""
+    global _compactor
+    if ARCHIVE_AFTER_DAYS <= 0 and RETENTION_DAYS <= 0:
+        return None
+    with _compactor_lock:
+        if _compactor is None or not _compactor.is_alive():
+            _compactor = Compactor()
+            _compactor.start()
+        return _compactor
+
+
+# Function to report compactor statistics
+def stats():
+    """Return the running compactor's statistics, or None if it has not been started"""
+    with _compactor_lock:
+        compactor = _compactor
+    return compactor.stats() if compactor is not None else None
@@ -0,0 +1,272 @@
+"""Process-wide asset caches shared by every Streamlit session.
+
+Streamlit re-executes app.py from the top on every rerun, so anything defined
+at module level there is rebuilt each time. This module is imported once per
+process, which makes it the place for state that should outlive a rerun.
+"""
+import functools
+import hashlib
+import io
+import json
+import os
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).parent
+IMAGES_DIR = ROOT_DIR / "images"
+
+# Resized variants written by build_assets.py
+STATIC_DIR = ROOT_DIR / "static"
+VARIANTS_DIR = STATIC_DIR / "img"
+VARIANT_MANIFEST = VARIANTS_DIR / "manifest.json"
+
+# Server or CDN publishing static/ and images/ under content-hashed URLs
+# (static_server.py --assets); empty means everything goes through Streamlit
+ASSET_BASE_URL = os.getenv("PORTFOLIO_ASSET_BASE_URL", "").rstrip("/")
+
+# Approximate width (CSS pixels) of the main content area in the wide layout
+PAGE_WIDTH = 1200
+# Images are served at this multiple of their CSS width to stay sharp on high-DPI screens
+IMAGE_DENSITY = 2
+# st.image downsizes anything wider than this (twice its 730px content width) on every call
+MAX_IMAGE_WIDTH = 1460
+
+
+# Function to get the pixel width an image needs to fill a column
+def column_width(fraction):
+    """Return the image width needed for a column spanning `fraction` of the page"""
+    return int(PAGE_WIDTH * fraction * IMAGE_DENSITY)
+
+
+class ImageCache:
+    """LRU cache of display-sized, already encoded images, bounded by total bytes
+
+    Entries are keyed on (path, mtime_ns, size, width), so an edited file or a
+    different display width is a new entry. Images are downscaled to the width
+    they are shown at and stored as JPEG (PNG when they have transparency),
+    which st.image passes through without decoding or re-encoding them again.
+    """
+
+    def __init__(self, max_bytes=32 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, image_path, width=None):
+        """Return encoded bytes of the image at image_path at most `width` pixels wide, or None if it does not exist"""
+        image_path = str(image_path)
+        try:
+            stat = os.stat(image_path)
+        except FileNotFoundError:
+            return None
+        width = min(width or MAX_IMAGE_WIDTH, MAX_IMAGE_WIDTH)
+        key = (image_path, stat.st_mtime_ns, stat.st_size, width)
+
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return data
+            self.misses += 1
+
+        # Encode outside the lock so one slow file does not block other sessions
+        data = encode_for_display(image_path, width)
+
+        with self._lock:
+            # A changed file gets a new key; drop the entries for its old version
+            for stale_key in [k for k in self._entries if k[0] == image_path and k[1:3] != key[1:3]]:
+                self._bytes -= len(self._entries.pop(stale_key))
+            if key not in self._entries and len(data) <= self.max_bytes:
+                self._entries[key] = data
+                self._bytes += len(data)
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+                self.evictions += 1
+        return data
+
+    def clear(self):
+        """Drop every cached image (counters are kept)"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def size_bytes(self):
+        """Return the memory held by the encoded images"""
+        with self._lock:
+            return self._bytes
+
+    def stats(self):
+        """Return hit/miss/eviction counters and the current size"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+# Function to shrink and encode an image for the page
+def encode_for_display(image_path, width):
+    """Return the image at image_path scaled down to `width` pixels and encoded as JPEG or PNG"""
+    # PIL is imported on first use to keep it off the startup path
+    from PIL import Image
+
+    with Image.open(image_path) as image:
+        if image.width <= width and image.format in ("JPEG", "PNG"):
+            with open(image_path, "rb") as f:
+                return f.read()
+        # thumbnail() lets JPEG decode at a reduced scale instead of at full size
+        image.thumbnail((width, image.height * width // image.width or 1))
+        buffer = io.BytesIO()
+        if image.mode in ("RGBA", "LA") or "transparency" in image.info:
+            image.save(buffer, format="PNG", optimize=True)
+        else:
+            image.convert("RGB").save(buffer, format="JPEG", quality=85, optimize=True, progressive=True)
+        return buffer.getvalue()
+
+
+# Function to render a solid-color placeholder
+@functools.lru_cache(maxsize=64)
+def placeholder_png(width, height, color="#5846f6"):
+    """Return PNG bytes for a placeholder, encoded once per (width, height, color) and shared"""
+    from PIL import Image
+
+    buffer = io.BytesIO()
+    Image.new("RGB", (width, height), color=color).save(buffer, format="PNG", optimize=True)
+    return buffer.getvalue()
+
+
+image_cache = ImageCache(max_bytes=int(float(os.getenv("PORTFOLIO_IMAGE_CACHE_MB", "32")) * 1024 * 1024))
+
+
+class VariantManifest:
+    """Variant manifest produced by build_assets.py, reloaded when the file changes"""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._mtime_ns = None
+        self._images = {}
+
+    def _current(self):
+        """Return the image entries, reloading the manifest if it changed on disk"""
+        try:
+            mtime_ns = os.stat(self.path).st_mtime_ns
+        except FileNotFoundError:
+            mtime_ns = None
+        with self._lock:
+            if mtime_ns != self._mtime_ns:
+                self._images = self._load() if mtime_ns is not None else {}
+                self._mtime_ns = mtime_ns
+            return self._images
+
+    def _load(self):
+        """Read the manifest, keeping only entries whose source image is unchanged"""
+        try:
+            with open(self.path, "r") as f:
+                images = json.load(f).get("images", {})
+        except (OSError, json.JSONDecodeError):
+            return {}
+        fresh = {}
+        for name, entry in images.items():
+            try:
+                stat = os.stat(IMAGES_DIR / name)
+            except FileNotFoundError:
+                continue
+            if entry["source_mtime_ns"] == stat.st_mtime_ns and entry["source_size"] == stat.st_size:
+                fresh[name] = entry
+        return fresh
+
+    def variants(self, relative_path, formats=("webp",)):
+        """Return the variants of an image in the given formats, narrowest first"""
+        entry = self._current().get(relative_path)
+        if entry is None:
+            return []
+        matching = [v for v in entry["variants"] if v["format"] in formats]
+        return sorted(matching, key=lambda v: (v["width"], v["bytes"]))
+
+    def pick(self, relative_path, display_width, formats=("webp",)):
+        """Return the smallest variant at least display_width pixels wide, or None"""
+        candidates = self.variants(relative_path, formats)
+        if not candidates:
+            return None
+        for variant in candidates:
+            if variant["width"] >= display_width:
+                return variant
+        # Nothing is wide enough; the widest variant is the original resolution
+        return candidates[-1]
+
+
+variant_manifest = VariantManifest(VARIANT_MANIFEST)
+
+
+# Function to resolve the file an image should be decoded from
+def image_path(relative_path, display_width=None):
+    """Return the path of an image in images/, or of its best variant for display_width"""
+    if display_width is not None:
+        variant = variant_manifest.pick(relative_path, display_width)
+        if variant is not None:
+            return VARIANTS_DIR / variant["file"]
+    return IMAGES_DIR / relative_path
+
+
+# Content fingerprint in a file name: <stem>.<first 12 hex digits of sha256><suffix>
+_FINGERPRINT = re.compile(r"^(?P<stem>.+)\.(?P<digest>[0-9a-f]{12})(?P<suffix>\.[^.]+)$")
+
+
+class FileDigests:
+    """SHA-256 digests of files, recomputed only when a file's mtime or size changes"""
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, path):
+        """Return the hex SHA-256 of the file at path"""
+        path = str(path)
+        stat = os.stat(path)
+        key = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            entry = self._entries.get(path)
+        if entry is not None and entry[0] == key:
+            return entry[1]
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        with self._lock:
+            self._entries[path] = (key, digest.hexdigest())
+        return digest.hexdigest()
+
+
+file_digests = FileDigests()
+
+
+# Function to give a file a content-hashed name
+def fingerprinted_path(path):
+    """Return path relative to the project root with its content hash in the file name"""
+    path = Path(path)
+    digest = file_digests.get(path)[:12]
+    return path.relative_to(ROOT_DIR).with_name(f"{path.stem}.{digest}{path.suffix}").as_posix()
+
+
+# Function to take a content hash back out of a file name
+def split_fingerprint(name):
+    """Return (original name, fingerprint), or (name, None) if the name carries no fingerprint"""
+    match = _FINGERPRINT.match(name)
+    if match is None:
+        return name, None
+    return match["stem"] + match["suffix"], match["digest"]
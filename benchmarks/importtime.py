@@ -0,0 +1,128 @@
+"""Import-time report for the portfolio's own modules, with a regression budget.
+
+Runs a fresh interpreter with `python -X importtime`, importing Streamlit
+first so that only the cost the app's modules add on top of it is counted,
+and prints the per-module breakdown plus the heaviest nested imports.
+
+    python benchmarks/importtime.py             # report, exit 1 if over budget
+    python benchmarks/importtime.py --json      # machine-readable output
+    python benchmarks/importtime.py --no-baseline --runs 1
+
+The budget lives in import_budget.json next to this script: a total in
+milliseconds for the app's modules and a list of packages that must not be
+imported at startup at all.
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+BUDGET_PATH = Path(__file__).resolve().parent / "import_budget.json"
+
+
+# Function to import the given modules in a fresh interpreter and capture -X importtime output
+def run_importtime(modules, baseline):
+    """Return the parsed (self_us, cumulative_us, depth, name) rows of one cold import"""
+    statements = [f"import {baseline}"] if baseline else []
+    statements += [f"import {module}" for module in modules]
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "; ".join(statements)],
+        cwd=ROOT_DIR, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((int(self_us), int(cumulative_us), depth, name.strip()))
+    return rows
+
+
+# Function to attribute nested imports to the top-level import that triggered them
+def group_rows(rows):
+    """Return {top-level module: [rows it pulled in, ending with its own row]}"""
+    groups, pending = {}, []
+    for row in rows:
+        pending.append(row)
+        if row[2] == 0:
+            groups[row[3]] = pending
+            pending = []
+    return groups
+
+
+# Function to measure the app modules over several runs
+def measure(modules, baseline, runs):
+    """Return median cumulative ms per module, the heaviest nested imports and every module imported"""
+    per_module = {module: [] for module in modules}
+    nested = {}
+    imported = set()
+    for _ in range(runs):
+        groups = group_rows(run_importtime(modules, baseline))
+        for module in modules:
+            group = groups.get(module, [])
+            per_module[module].append(group[-1][1] / 1000 if group else 0.0)
+            for self_us, _, _, name in group:
+                imported.add(name)
+                nested.setdefault(name, []).append(self_us / 1000)
+    medians = {module: statistics.median(times) for module, times in per_module.items()}
+    heaviest = sorted(((statistics.median(t), name) for name, t in nested.items()), reverse=True)
+    return medians, heaviest, imported
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Profile the app's import time against a budget")
+    parser.add_argument("--budget", default=str(BUDGET_PATH), help="budget JSON file")
+    parser.add_argument("--runs", type=int, default=5, help="cold imports to take the median of")
+    parser.add_argument("--top", type=int, default=10, help="nested imports to list")
+    parser.add_argument("--no-baseline", action="store_true", help="do not pre-import the baseline package")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    budget = json.loads(Path(args.budget).read_text())
+    baseline = None if args.no_baseline else budget.get("baseline")
+    try:
+        medians, heaviest, imported = measure(budget["modules"], baseline, args.runs)
+    except RuntimeError as exc:
+        print(f"import failed: {exc}", file=sys.stderr)
+        return 2
+    total_ms = sum(medians.values())
+    forbidden = sorted(
+        name for name in imported if name.split(".")[0] in budget.get("forbidden", ())
+    )
+    over_budget = total_ms > budget["total_ms"]
+
+    if args.json:
+        print(json.dumps({
+            "baseline": baseline,
+            "runs": args.runs,
+            "modules_ms": medians,
+            "total_ms": total_ms,
+            "budget_ms": budget["total_ms"],
+            "heaviest_ms": [{"module": name, "self_ms": ms} for ms, name in heaviest[:args.top]],
+            "forbidden_imported": forbidden,
+        }, indent=2))
+    else:
+        print(f"Import time on top of {baseline or 'a bare interpreter'} (median of {args.runs} runs)")
+        for module, ms in sorted(medians.items(), key=lambda item: -item[1]):
+            print(f"  {module:<20} {ms:8.1f} ms")
+        print(f"  {'total':<20} {total_ms:8.1f} ms  (budget {budget['total_ms']} ms)")
+        print("Heaviest nested imports (self time):")
+        for ms, name in heaviest[:args.top]:
+            print(f"  {name:<40} {ms:8.1f} ms")
+        if forbidden:
+            print(f"Imported at startup but should load on first use: {', '.join(forbidden)}")
+
+    if over_budget or forbidden:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
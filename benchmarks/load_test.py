@@ -0,0 +1,215 @@
+"""Offline load test: many concurrent visitor sessions against app.py.
+
+Each simulated visitor is an AppTest session running in its own thread inside
+this process, so every session shares the same process-wide caches, message
+store and notification worker, just like sessions of one Streamlit server.
+Visitors mix page views, theme toggles and contact form submissions. Email
+goes to an in-process SMTP sink and messages to a throwaway database, so the
+run is fully offline.
+
+    python benchmarks/load_test.py --sessions 20 --duration 60
+    python benchmarks/load_test.py --sessions 50 --mix view=60,theme=20,submit=20 --json
+
+Reports throughput, p50/p95/p99 latency and error rate per action, the
+process RSS, and how many messages were stored and emails delivered.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from rerun_bench import APP_PATH, submit_button  # noqa: E402
+
+DEFAULT_MIX = "view=70,theme=20,submit=10"
+
+
+# Function to parse the action mix
+def parse_mix(text):
+    """Turn "view=70,theme=20,submit=10" into ([actions], [weights])"""
+    actions, weights = [], []
+    for part in text.split(","):
+        action, _, weight = part.partition("=")
+        if action not in ("view", "theme", "submit"):
+            raise argparse.ArgumentTypeError(f"unknown action {action!r}")
+        actions.append(action)
+        weights.append(float(weight))
+    return actions, weights
+
+
+# Function to read the process memory
+def rss_kb():
+    """Return (current RSS, peak RSS) of this process in KB"""
+    try:
+        with open("/proc/self/status") as f:
+            fields = dict(line.split(":", 1) for line in f)
+        return int(fields["VmRSS"].split()[0]), int(fields["VmHWM"].split()[0])
+    except (OSError, KeyError):
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return None, peak // 1024 if sys.platform == "darwin" else peak
+
+
+class Visitor(threading.Thread):
+    """One simulated visitor performing random actions until the deadline"""
+
+    def __init__(self, number, deadline, mix, timeout, results, results_lock):
+        super().__init__(name=f"visitor-{number}", daemon=True)
+        self.number = number
+        self.deadline = deadline
+        self.actions, self.weights = mix
+        self.timeout = timeout
+        self.results = results
+        self.results_lock = results_lock
+        self.random = random.Random(number)
+
+    def run(self):
+        from streamlit.testing.v1 import AppTest
+
+        at = AppTest.from_file(str(APP_PATH), default_timeout=self.timeout)
+        self._perform(at, "first_view")
+        theme_index = 0
+        submitted = 0
+        while time.monotonic() < self.deadline:
+            action = self.random.choices(self.actions, self.weights)[0]
+            if action == "theme":
+                theme_index = 1 - theme_index
+                at.selectbox(key="theme").set_value(("Blue", "Green")[theme_index])
+            elif action == "submit":
+                submitted += 1
+                at.text_input(key="name").input(f"Load visitor {self.number}")
+                at.text_input(key="email").input(f"visitor{self.number}.{submitted}@example.com")
+                at.text_area(key="message").input(f"Load test message {submitted} from visitor {self.number}")
+                submit_button(at).click()
+            self._perform(at, action)
+
+    def _perform(self, at, action):
+        started = time.perf_counter()
+        try:
+            at.run(timeout=self.timeout)
+            failed = bool(at.exception)
+        except Exception:
+            failed = True
+        elapsed = time.perf_counter() - started
+        with self.results_lock:
+            self.results.append((action, elapsed, failed))
+
+
+# Function to summarise the recorded actions
+def summarize(results, wall_seconds):
+    """Return overall and per-action throughput, latency percentiles and error rates"""
+    from timings import percentile
+
+    report = {"wall_s": wall_seconds, "actions": len(results),
+              "throughput_per_s": len(results) / wall_seconds if wall_seconds else 0.0}
+    by_action = {}
+    for action, elapsed, failed in results:
+        by_action.setdefault(action, []).append((elapsed, failed))
+    for action, samples in sorted(by_action.items()):
+        latencies = sorted(elapsed for elapsed, _ in samples)
+        errors = sum(1 for _, failed in samples if failed)
+        report[action] = {
+            "count": len(samples),
+            "per_s": len(samples) / wall_seconds if wall_seconds else 0.0,
+            "p50_ms": percentile(latencies, 0.50) * 1000,
+            "p95_ms": percentile(latencies, 0.95) * 1000,
+            "p99_ms": percentile(latencies, 0.99) * 1000,
+            "error_rate": errors / len(samples),
+        }
+    total_errors = sum(1 for _, _, failed in results if failed)
+    report["error_rate"] = total_errors / len(results) if results else 0.0
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulate concurrent visitors against app.py")
+    parser.add_argument("--sessions", type=int, default=10, help="concurrent visitor sessions")
+    parser.add_argument("--duration", type=float, default=30, help="seconds to keep the load running")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix(DEFAULT_MIX),
+                        help=f"action weights (default {DEFAULT_MIX})")
+    parser.add_argument("--timeout", type=float, default=60, help="seconds allowed per script run")
+    parser.add_argument("--drain-timeout", type=float, default=30,
+                        help="seconds to wait for queued emails after the load stops")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    from smtp_sink import SMTPSink
+
+    # Fully offline: a throwaway database and a local SMTP sink
+    sink = SMTPSink(port=0).start()
+    os.environ.update({
+        "PORTFOLIO_DATA_DIR": tempfile.mkdtemp(prefix="portfolio-load-"),
+        "SMTP_SERVER": sink.host,
+        "SMTP_PORT": str(sink.port),
+        "SMTP_STARTTLS": "0",
+        "SENDER_EMAIL": "load-test@example.com",
+        "SENDER_PASSWORD": "",
+        "RECIPIENT_EMAIL": "owner@example.com",
+    })
+    # Measure storage and rendering, not the contact form rate limiter
+    for name in ("CONTACT_BURST", "CONTACT_HOURLY_LIMIT", "CONTACT_GLOBAL_HOURLY_LIMIT"):
+        os.environ.setdefault(name, "1000000000")
+
+    import notifications
+    from message_store import message_store
+
+    rss_before, _ = rss_kb()
+    results, results_lock = [], threading.Lock()
+    started = time.monotonic()
+    deadline = started + args.duration
+    visitors = [Visitor(n, deadline, args.mix, args.timeout, results, results_lock) for n in range(args.sessions)]
+    for visitor in visitors:
+        visitor.start()
+    for visitor in visitors:
+        visitor.join()
+    wall_seconds = time.monotonic() - started
+    rss_after, rss_peak = rss_kb()
+
+    # Give the background worker a chance to deliver what the visitors queued
+    stored = message_store.count()
+    drain_deadline = time.monotonic() + args.drain_timeout
+    while message_store.due_notification_summary()[0] and time.monotonic() < drain_deadline:
+        notifications.start_worker().wake()
+        time.sleep(0.2)
+
+    report = summarize(results, wall_seconds)
+    report.update({
+        "sessions": args.sessions,
+        "rss_before_kb": rss_before,
+        "rss_after_kb": rss_after,
+        "rss_peak_kb": rss_peak,
+        "messages_stored": stored,
+        "emails_received": len(sink.messages),
+        "smtp_connections": sink.connections,
+        "notifications_pending": message_store.due_notification_summary()[0],
+        "notification_worker": notifications.worker_stats(),
+    })
+    sink.stop()
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(f"{args.sessions} sessions, {report['actions']} actions in {wall_seconds:.1f}s "
+              f"({report['throughput_per_s']:.1f}/s), error rate {report['error_rate']:.1%}")
+        print(f"{'action':<12} {'count':>7} {'per s':>7} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'errors':>7}")
+        for action in ("first_view", "view", "theme", "submit"):
+            if action in report:
+                row = report[action]
+                print(f"{action:<12} {row['count']:>7} {row['per_s']:>7.1f} {row['p50_ms']:>8.1f} "
+                      f"{row['p95_ms']:>8.1f} {row['p99_ms']:>8.1f} {row['error_rate']:>7.1%}")
+        print(f"RSS: {rss_before} KB before, {rss_after} KB after, {rss_peak} KB peak")
+        print(f"Messages stored: {stored}, emails received: {len(sink.messages)} "
+              f"over {sink.connections} SMTP connection(s), still pending: {report['notifications_pending']}")
+
+    return 1 if report["error_rate"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,208 @@
+"""Headless latency benchmark for app.py using Streamlit's AppTest.
+
+Measures, in one fresh interpreter:
+  - cold start: the first full run, which imports and warms the app's modules
+  - warm rerun latency of the whole page
+  - theme switch latency
+  - contact form submit latency (into a throwaway database, with email off)
+  - peak Python memory allocated while one new session renders the page
+
+Each run is appended to history.jsonl next to this script, tagged with the
+git commit, and compared with the previous entry so regressions show up
+between commits.
+
+    python benchmarks/rerun_bench.py
+    python benchmarks/rerun_bench.py --iterations 50 --fail-on-regression 20
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+APP_PATH = ROOT_DIR / "app.py"
+HISTORY_PATH = Path(__file__).resolve().parent / "history.jsonl"
+
+# Metrics where a higher value is a regression, compared against the previous run
+COMPARED_METRICS = (
+    "cold_start_ms",
+    "rerun_p50_ms",
+    "rerun_p95_ms",
+    "theme_switch_p50_ms",
+    "contact_submit_p50_ms",
+    "session_peak_kb",
+)
+
+
+# Function to summarise latency samples
+def summarize(samples):
+    """Return p50/p95/max in milliseconds for a list of durations in seconds"""
+    ordered = sorted(samples)
+    p95_index = max(0, round(0.95 * len(ordered)) - 1)
+    return {
+        "p50_ms": statistics.median(ordered) * 1000,
+        "p95_ms": ordered[p95_index] * 1000,
+        "max_ms": ordered[-1] * 1000,
+    }
+
+
+# Function to time one AppTest action
+def timed_run(at, timeout):
+    """Run the script once and return (seconds taken, exceptions raised by the script)"""
+    started = time.perf_counter()
+    at.run(timeout=timeout)
+    return time.perf_counter() - started, len(at.exception)
+
+
+# Function to find the contact form's submit button
+def submit_button(at):
+    return next(button for button in at.button if button.label == "Send Message")
+
+
+def run_benchmark(iterations, timeout):
+    """Drive app.py through AppTest and return the measured metrics"""
+    from streamlit.testing.v1 import AppTest
+
+    errors = 0
+    at = AppTest.from_file(str(APP_PATH), default_timeout=timeout)
+    cold, failed = timed_run(at, timeout)
+    errors += failed
+
+    import warmup
+    warmup.start().wait(timeout)
+
+    reruns = []
+    for _ in range(iterations):
+        seconds, failed = timed_run(at, timeout)
+        reruns.append(seconds)
+        errors += failed
+
+    theme_switches = []
+    themes = ["Green", "Blue"]
+    for i in range(iterations):
+        at.selectbox(key="theme").set_value(themes[i % 2])
+        seconds, failed = timed_run(at, timeout)
+        theme_switches.append(seconds)
+        errors += failed
+
+    submits = []
+    for i in range(iterations):
+        at.text_input(key="name").input(f"Benchmark visitor {i}")
+        at.text_input(key="email").input(f"visitor{i}@example.com")
+        at.text_area(key="message").input("Benchmark message " * 20)
+        submit_button(at).click()
+        seconds, failed = timed_run(at, timeout)
+        submits.append(seconds)
+        errors += failed
+
+    # Memory is measured last and separately, since tracing slows everything down
+    tracemalloc.start()
+    session = AppTest.from_file(str(APP_PATH), default_timeout=timeout)
+    session.run(timeout=timeout)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    errors += len(session.exception)
+
+    rerun, theme, submit = summarize(reruns), summarize(theme_switches), summarize(submits)
+    return {
+        "cold_start_ms": cold * 1000,
+        "rerun_p50_ms": rerun["p50_ms"],
+        "rerun_p95_ms": rerun["p95_ms"],
+        "rerun_max_ms": rerun["max_ms"],
+        "reruns_per_s": len(reruns) / sum(reruns),
+        "theme_switch_p50_ms": theme["p50_ms"],
+        "theme_switch_p95_ms": theme["p95_ms"],
+        "contact_submit_p50_ms": submit["p50_ms"],
+        "contact_submit_p95_ms": submit["p95_ms"],
+        "session_peak_kb": peak / 1024,
+        "script_errors": errors,
+    }
+
+
+# Function to identify the code being measured
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+# Function to read the previous benchmark entry
+def last_entry(history_path):
+    try:
+        with open(history_path) as f:
+            lines = [line for line in f if line.strip()]
+    except FileNotFoundError:
+        return None
+    return json.loads(lines[-1]) if lines else None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark app.py reruns headlessly with AppTest")
+    parser.add_argument("--iterations", type=int, default=20, help="samples per measured action")
+    parser.add_argument("--timeout", type=float, default=60, help="seconds allowed per script run")
+    parser.add_argument("--history", default=str(HISTORY_PATH), help="JSON lines file to append results to")
+    parser.add_argument("--no-save", action="store_true", help="do not append this run to the history")
+    parser.add_argument("--fail-on-regression", type=float, metavar="PERCENT",
+                        help="exit 1 if a metric got this much worse than the previous run")
+    args = parser.parse_args(argv)
+
+    # Keep benchmark submissions out of the real inbox and never send email
+    os.environ["PORTFOLIO_DATA_DIR"] = tempfile.mkdtemp(prefix="portfolio-bench-")
+    for name in ("SENDER_EMAIL", "SENDER_PASSWORD", "RECIPIENT_EMAIL"):
+        os.environ.pop(name, None)
+    # Measure storage and rendering, not the contact form rate limiter
+    for name in ("CONTACT_BURST", "CONTACT_HOURLY_LIMIT", "CONTACT_GLOBAL_HOURLY_LIMIT"):
+        os.environ.setdefault(name, "1000000000")
+    sys.path.insert(0, str(ROOT_DIR))
+
+    import streamlit
+
+    metrics = run_benchmark(args.iterations, args.timeout)
+    entry = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "streamlit": streamlit.__version__,
+        "iterations": args.iterations,
+        "metrics": metrics,
+    }
+
+    previous = last_entry(args.history)
+    regressions = []
+    print(f"{'metric':<24} {'value':>10} {'previous':>10} {'change':>8}")
+    for name, value in metrics.items():
+        before = previous["metrics"].get(name) if previous else None
+        change = ""
+        if before:
+            percent = (value - before) / before * 100
+            change = f"{percent:+.0f}%"
+            if (args.fail_on_regression is not None and name in COMPARED_METRICS
+                    and percent > args.fail_on_regression):
+                regressions.append(name)
+        previous_text = f"{before:.1f}" if before is not None else "-"
+        print(f"{name:<24} {value:>10.1f} {previous_text:>10} {change:>8}")
+
+    if not args.no_save:
+        with open(args.history, "a") as f:
+            f.write(json.dumps(entry) + "\n")
+
+    if metrics["script_errors"]:
+        print(f"app.py raised {metrics['script_errors']} exception(s) during the benchmark")
+        return 1
+    if regressions:
+        print(f"Regressed by more than {args.fail_on_regression}%: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
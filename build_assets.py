@@ -0,0 +1,141 @@
+"""Offline asset build for the portfolio.
+
+Produces width-bucketed, recompressed WebP (and AVIF, when Pillow supports it)
+variants of every image in images/ plus a manifest that app.py uses to pick
+the smallest variant that still fills a column.
+
+    python build_assets.py            # build changed images only
+    python build_assets.py --force    # rebuild everything
+"""
+import argparse
+import json
+import os
+import sys
+
+from PIL import Image, ImageOps, features
+
+from assets import IMAGES_DIR, VARIANTS_DIR, VARIANT_MANIFEST
+
+# Widths (in pixels) that variants are bucketed into
+VARIANT_WIDTHS = (320, 640, 960, 1280)
+
+SOURCE_EXTENSIONS = {".jpg", ".jpeg", ".png"}
+
+# Encoder settings per output format
+FORMAT_OPTIONS = {
+    "webp": {"format": "WEBP", "quality": 80, "method": 6},
+    "avif": {"format": "AVIF", "quality": 50, "speed": 6},
+}
+
+
+# Function to list the output formats this Pillow build can encode
+def available_formats():
+    """Return the variant formats supported by the installed Pillow"""
+    formats = ["webp"]
+    if features.check("avif"):
+        formats.append("avif")
+    return formats
+
+
+# Function to choose the widths to generate for one image
+def target_widths(source_width):
+    """Return the bucket widths for an image, never upscaling past the original"""
+    widths = [w for w in VARIANT_WIDTHS if w < source_width]
+    # Always keep a full-resolution (but recompressed) variant
+    widths.append(source_width)
+    return widths
+
+
+# Function to build every variant for one source image
+def build_variants(source_path, formats):
+    """Resize and recompress one image, returning its manifest entry"""
+    stat = source_path.stat()
+    with Image.open(source_path) as original:
+        image = ImageOps.exif_transpose(original)
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "transparency" in image.info else "RGB")
+
+        variants = []
+        for width in target_widths(image.width):
+            height = round(image.height * width / image.width)
+            resized = image if width == image.width else image.resize((width, height), Image.LANCZOS)
+            for fmt in formats:
+                file_name = f"{source_path.stem}-{width}.{fmt}"
+                resized.save(VARIANTS_DIR / file_name, **FORMAT_OPTIONS[fmt])
+                variants.append({
+                    "width": width,
+                    "height": height,
+                    "format": fmt,
+                    "file": file_name,
+                    "bytes": (VARIANTS_DIR / file_name).stat().st_size,
+                })
+
+        return {
+            "source_mtime_ns": stat.st_mtime_ns,
+            "source_size": stat.st_size,
+            "width": image.width,
+            "height": image.height,
+            "variants": variants,
+        }
+
+
+# Function to read a previous manifest, if any
+def load_previous_manifest():
+    """Return the existing manifest's image entries, or an empty dict"""
+    try:
+        with open(VARIANT_MANIFEST, "r") as f:
+            return json.load(f).get("images", {})
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build responsive image variants")
+    parser.add_argument("--force", action="store_true", help="rebuild images that have not changed")
+    args = parser.parse_args(argv)
+
+    VARIANTS_DIR.mkdir(parents=True, exist_ok=True)
+    formats = available_formats()
+    previous = {} if args.force else load_previous_manifest()
+    images = {}
+    original_total = 0
+    smallest_total = 0
+
+    for source_path in sorted(IMAGES_DIR.iterdir()):
+        if source_path.suffix.lower() not in SOURCE_EXTENSIONS:
+            continue
+        stat = source_path.stat()
+        entry = previous.get(source_path.name)
+        up_to_date = (
+            entry is not None
+            and entry["source_mtime_ns"] == stat.st_mtime_ns
+            and entry["source_size"] == stat.st_size
+            and all((VARIANTS_DIR / v["file"]).exists() for v in entry["variants"])
+        )
+        if not up_to_date:
+            print(f"building {source_path.name}")
+            entry = build_variants(source_path, formats)
+        images[source_path.name] = entry
+
+        original_total += stat.st_size
+        smallest_total += min(v["bytes"] for v in entry["variants"])
+
+    # Remove variants of images that no longer exist or were rebuilt narrower
+    keep = {v["file"] for entry in images.values() for v in entry["variants"]}
+    for path in VARIANTS_DIR.iterdir():
+        if path.name != VARIANT_MANIFEST.name and path.name not in keep:
+            path.unlink()
+
+    manifest = {"version": 1, "widths": list(VARIANT_WIDTHS), "formats": formats, "images": images}
+    tmp_path = VARIANT_MANIFEST.with_suffix(".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f, indent=4)
+    os.replace(tmp_path, VARIANT_MANIFEST)
+
+    print(f"{len(images)} images, {original_total / 1024:.0f} KB originals, "
+          f"{smallest_total / 1024:.0f} KB at the smallest bucket")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
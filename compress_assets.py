@@ -0,0 +1,131 @@
+"""Write precompressed .gz and .br siblings for text assets.
+
+    python compress_assets.py            # static/ and dist/
+    python compress_assets.py dist --force
+
+Every compressible file (CSS, JavaScript, HTML, SVG, JSON, ...) gets a gzip
+sibling, plus a brotli one when the optional `brotli` package is installed,
+so static_server.py can send the smaller encoding the client accepts without
+compressing anything per request. Siblings take their source's modification
+time, which is how stale ones are recognised, and are only kept when they
+are actually smaller. Images are skipped; their formats are compressed already.
+"""
+import argparse
+import gzip
+import os
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).parent
+DEFAULT_DIRS = (ROOT_DIR / "static", ROOT_DIR / "dist")
+
+COMPRESSIBLE_SUFFIXES = {".css", ".js", ".html", ".svg", ".json", ".txt", ".xml", ".map"}
+# Smaller files do not gain enough to be worth a second request path
+MIN_SIZE = 256
+# Encodings in order of preference, with the file suffix of their siblings
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+
+# Function to get the optional brotli module
+def _brotli():
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli
+
+
+# Function to compress bytes with one encoding
+def compress_bytes(data, encoding):
+    """Return data compressed with `encoding`, or None if that encoder is unavailable"""
+    if encoding == "gzip":
+        # mtime=0 keeps the output (and so its ETag) identical across builds
+        return gzip.compress(data, compresslevel=9, mtime=0)
+    brotli = _brotli()
+    if brotli is None:
+        return None
+    return brotli.compress(data, quality=11)
+
+
+# Function to find a usable precompressed copy of a file
+def precompressed_sibling(path, encoding):
+    """Return the path of an up-to-date `encoding` sibling of path, or None"""
+    suffix = dict(ENCODINGS)[encoding]
+    sibling = Path(f"{path}{suffix}")
+    try:
+        return sibling if sibling.stat().st_mtime_ns == Path(path).stat().st_mtime_ns else None
+    except FileNotFoundError:
+        return None
+
+
+# Function to write the precompressed siblings of one file
+def compress_file(path, force=False):
+    """Write the .gz/.br siblings of path; return {encoding: compressed size} for those written"""
+    path = Path(path)
+    stat = path.stat()
+    written = {}
+    if path.suffix.lower() not in COMPRESSIBLE_SUFFIXES or stat.st_size < MIN_SIZE:
+        return written
+    data = None
+    for encoding, suffix in ENCODINGS:
+        sibling = Path(f"{path}{suffix}")
+        if not force and precompressed_sibling(path, encoding) is not None:
+            continue
+        if data is None:
+            data = path.read_bytes()
+        compressed = compress_bytes(data, encoding)
+        if compressed is None or len(compressed) >= len(data):
+            sibling.unlink(missing_ok=True)
+            continue
+        tmp_path = sibling.with_name(sibling.name + ".tmp")
+        tmp_path.write_bytes(compressed)
+        os.utime(tmp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        os.replace(tmp_path, sibling)
+        written[encoding] = len(compressed)
+    return written
+
+
+# Function to compress every asset below a folder
+def compress_tree(root, force=False):
+    """Compress every asset under root and drop siblings whose source is gone; return the files written"""
+    root = Path(root)
+    if not root.is_dir():
+        return {}
+    suffixes = tuple(suffix for _, suffix in ENCODINGS)
+    results = {}
+    for path in sorted(root.rglob("*")):
+        if not path.is_file():
+            continue
+        if path.suffix in suffixes:
+            if not Path(str(path)[:-len(path.suffix)]).exists():
+                path.unlink()
+            continue
+        written = compress_file(path, force)
+        if written:
+            results[path] = (path.stat().st_size, written)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write precompressed .gz/.br siblings for static assets")
+    parser.add_argument("dirs", nargs="*", default=[str(d) for d in DEFAULT_DIRS])
+    parser.add_argument("--force", action="store_true", help="recompress files whose siblings are current")
+    args = parser.parse_args(argv)
+
+    if _brotli() is None:
+        print("brotli is not installed; writing gzip siblings only (pip install brotli)")
+    original_total = compressed_total = 0
+    for directory in args.dirs:
+        for path, (size, written) in compress_tree(directory, args.force).items():
+            best = min(written.values())
+            original_total += size
+            compressed_total += best
+            sizes = ", ".join(f"{encoding} {written_size / 1024:.1f} KB" for encoding, written_size in written.items())
+            print(f"{path}: {size / 1024:.1f} KB -> {sizes}")
+    if original_total:
+        print(f"compressed {original_total / 1024:.0f} KB to {compressed_total / 1024:.0f} KB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
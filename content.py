@@ -0,0 +1,260 @@
+"""Portfolio content loaded from content.json.
+
+The file is parsed once per process into immutable records (tuples and
+read-only mappings) that every session shares, and is re-read only when its
+modification time or size changes, so content can be edited without a restart.
+
+Projects are indexed by title, and project facets (tech stack, organization,
+type) are precomputed as one int bitset per facet value, bit i standing for
+the i-th project, so lookups, filtering and facet counts are a few dict
+lookups and AND/OR operations instead of scans over the projects.
+"""
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from types import MappingProxyType
+from typing import NamedTuple
+
+CONTENT_PATH = Path(__file__).parent / "content.json"
+
+
+class SkillCategory(NamedTuple):
+    name: str
+    icon: str
+    skills: tuple
+
+
+class Experience(NamedTuple):
+    role: str
+    organization: str
+    duration: str
+    image: str
+    caption: str
+    points: tuple
+
+
+class Accomplishment(NamedTuple):
+    title: str
+    icon: str
+    detail: str
+
+
+class Project(NamedTuple):
+    title: str
+    date: str
+    org: str
+    type: str
+    description: str
+    features: tuple
+    tech_stack: tuple
+    github: str
+    image: str
+
+
+class Education(NamedTuple):
+    degree: str
+    institution: str
+    location: str
+    duration: str
+    grade: str
+    courses: tuple
+
+
+class Certification(NamedTuple):
+    title: str
+    issuer: str
+    date: str
+
+
+class Language(NamedTuple):
+    name: str
+    proficiency: str
+    icon: str
+
+
+class PageImage(NamedTuple):
+    """An image on the page: its file in images/, caption, share of the page width, whether it
+    is only fetched once scrolled into view, and the (width, height, color) placeholder shown if
+    the file is missing"""
+    path: str
+    caption: str
+    fraction: float
+    lazy: bool
+    placeholder: tuple
+
+
+# Images laid out directly on the page, by the section showing them
+PAGE_IMAGES = MappingProxyType({
+    "profile": PageImage("profile.jpeg", None, 1 / 3, False, (300, 300, "#5846f6")),
+    "about": PageImage("about_me.jpeg", "Sivamahendranath Ragimanu", 1 / 3, False, (400, 400, "#4a3bf5")),
+    "projects": PageImage("main_project.jpg", "Projects", 1 / 3, True, (400, 300, "#6557f1")),
+    "education": PageImage("education.jpg", "Education Journey", 1, True, (600, 400, "#3527f5")),
+})
+
+
+# Function to describe the image shown with a work experience entry
+def experience_image(exp):
+    return PageImage(exp.image, exp.caption, 1, True, (800, 300, "#3b2ff5"))
+
+
+# Function to describe the image shown with a project card
+def project_image(project):
+    return PageImage(project.image, project.title, 1 / 2, True, (400, 300, "#5846f6"))
+
+
+# Function to list every image the page shows
+def page_images(content):
+    """Return the PageImage of every image on the page"""
+    return [*PAGE_IMAGES.values(), *map(experience_image, content.experience), *map(project_image, content.projects)]
+
+
+class Content(NamedTuple):
+    """One immutable snapshot of content.json plus its project title index and facet bitsets"""
+    version: str
+    skill_categories: tuple
+    soft_skills: tuple
+    experience: tuple
+    accomplishments: tuple
+    projects: tuple
+    education: tuple
+    certifications: tuple
+    languages: tuple
+    # Lower-cased title -> position in projects, which is also the project's bit in the facet bitsets
+    project_numbers: MappingProxyType
+    project_facets: MappingProxyType
+
+
+# Project facets: name shown in the UI -> values of a project under that facet
+PROJECT_FACETS = {
+    "Tech stack": lambda project: project.tech_stack,
+    "Organization": lambda project: (project.org,),
+    "Type": lambda project: (project.type,),
+}
+
+
+# Function to count the projects in a bitset
+def bit_count(bits):
+    return bin(bits).count("1")
+
+
+# Function to build the bitsets of one facet
+def _facet_bitsets(projects, values_of):
+    """Build a read-only mapping of facet value -> bitset of the projects having it, most common first"""
+    bitsets = {}
+    for i, project in enumerate(projects):
+        for value in values_of(project):
+            bitsets[value] = bitsets.get(value, 0) | 1 << i
+    return MappingProxyType(dict(sorted(bitsets.items(), key=lambda item: (-bit_count(item[1]), item[0].lower()))))
+
+
+# Function to find the projects matching facet selections
+def project_bitset(content, selections, skip=None):
+    """Return the bitset of projects matching selections ({facet: values}), ignoring facet `skip`
+
+    Values selected within one facet are alternatives; facets are combined.
+    """
+    bits = (1 << len(content.projects)) - 1
+    for facet, values in selections.items():
+        if facet == skip or not values:
+            continue
+        facet_bits = 0
+        for value in values:
+            facet_bits |= content.project_facets[facet].get(value, 0)
+        bits &= facet_bits
+    return bits
+
+
+# Function to count the projects each facet value would show
+def facet_counts(content, selections):
+    """Return {facet: {value: count}} given the selections on the other facets"""
+    counts = {}
+    for facet, bitsets in content.project_facets.items():
+        others = project_bitset(content, selections, skip=facet)
+        counts[facet] = {value: bit_count(bits & others) for value, bits in bitsets.items()}
+    return counts
+
+
+# Function to check whether a project is in a bitset
+def project_in(content, title, bits):
+    """Return True if the project called title is one of the projects in bits"""
+    number = content.project_numbers.get(title.lower())
+    return number is not None and bool(bits >> number & 1)
+
+
+# Function to list the projects in a bitset
+def projects_in(content, bits):
+    """Return the projects whose bits are set, in page order"""
+    return [project for i, project in enumerate(content.projects) if bits >> i & 1]
+
+
+# Function to turn the raw JSON document into a Content snapshot
+def parse_content(raw, version):
+    """Convert the decoded content.json document into immutable records"""
+    projects = tuple(
+        Project(
+            title=p["title"],
+            date=p["date"],
+            org=p["org"],
+            type=p["type"],
+            description=p["description"],
+            features=tuple(p["features"]),
+            tech_stack=tuple(p["tech_stack"]),
+            github=p["github"],
+            image=p.get("image") or "placeholder.jpg",
+        )
+        for p in raw["projects"]
+    )
+    return Content(
+        version=version,
+        skill_categories=tuple(
+            SkillCategory(c["name"], c["icon"], tuple(c["skills"])) for c in raw["skill_categories"]
+        ),
+        soft_skills=tuple(raw["soft_skills"]),
+        experience=tuple(Experience(**{**e, "points": tuple(e["points"])}) for e in raw["experience"]),
+        accomplishments=tuple(Accomplishment(**a) for a in raw["accomplishments"]),
+        projects=projects,
+        education=tuple(
+            Education(**{**e, "courses": tuple(e["courses"])}) for e in raw["education"]
+        ),
+        certifications=tuple(Certification(**c) for c in raw["certifications"]),
+        languages=tuple(Language(**lang) for lang in raw["languages"]),
+        project_numbers=MappingProxyType({p.title.lower(): i for i, p in enumerate(projects)}),
+        project_facets=MappingProxyType({
+            facet: _facet_bitsets(projects, values_of) for facet, values_of in PROJECT_FACETS.items()
+        }),
+    )
+
+
+class ContentStore:
+    """Holds the current Content snapshot and reloads it when the file changes"""
+
+    def __init__(self, path=CONTENT_PATH):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._signature = None
+        self._content = None
+
+    def get(self):
+        """Return the current Content, re-reading the file only if it changed"""
+        stat = os.stat(self.path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if signature == self._signature:
+            return self._content
+        with self._lock:
+            if signature != self._signature:
+                data = self.path.read_bytes()
+                version = hashlib.sha1(data).hexdigest()[:12]
+                self._content = parse_content(json.loads(data), version)
+                self._signature = signature
+            return self._content
+
+
+content_store = ContentStore()
+
+
+# Function to get the current portfolio content
+def load_content():
+    """Return the shared, immutable portfolio content"""
+    return content_store.get()
@@ -0,0 +1,177 @@
+"""Export contact messages as CSV, JSON Lines or Parquet.
+
+    python export_messages.py -o messages.csv
+    python export_messages.py --format jsonl --since 2025-01-01 --until 2025-03-31 > q1.jsonl
+    python export_messages.py -o messages.parquet
+
+Archived segments (see archive.py) and then the live store are read in
+chunks, and each chunk is written out as it arrives, so memory use stays flat
+however many messages are exported. Parquet needs the optional `pyarrow`
+package; each chunk becomes one row group.
+"""
+import argparse
+import csv
+import io
+import json
+import sys
+from datetime import date, datetime
+from pathlib import Path
+
+import archive
+from message_store import message_store
+
+FIELDS = ("id", "name", "email", "message", "timestamp", "read")
+CHUNK_SIZE = 1000
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+# MIME type and file suffix of each format
+FORMATS = {
+    "csv": ("text/csv", ".csv"),
+    "jsonl": ("application/x-ndjson", ".jsonl"),
+    "parquet": ("application/vnd.apache.parquet", ".parquet"),
+}
+
+
+# Function to get the optional pyarrow modules
+def _pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        return None
+    return pyarrow
+
+
+# Function to list the formats that can be written here
+def available_formats():
+    """Return the export formats usable in this environment"""
+    return [fmt for fmt in FORMATS if fmt != "parquet" or _pyarrow() is not None]
+
+
+# Function to turn a date or command line value into a store bound
+def timestamp_bound(value, end=False):
+    """Return value as a "%Y-%m-%d %H:%M:%S" string; a bare date covers its whole day"""
+    if value is None or isinstance(value, str) and not value:
+        return None
+    if isinstance(value, str):
+        try:
+            return datetime.strptime(value, TIMESTAMP_FORMAT).strftime(TIMESTAMP_FORMAT)
+        except ValueError:
+            value = date.fromisoformat(value)
+    if isinstance(value, datetime):
+        return value.strftime(TIMESTAMP_FORMAT)
+    return value.strftime("%Y-%m-%d") + (" 23:59:59" if end else " 00:00:00")
+
+
+# Function to keep spreadsheets from running visitor text as formulas
+def _csv_cell(value):
+    """Prefix text starting with a formula character with a quote, so Excel and Sheets show it as text"""
+    if isinstance(value, str) and value[:1] in ("=", "+", "-", "@", "\t", "\r"):
+        return "'" + value
+    return value
+
+
+def _write_csv(chunks, out):
+    text = io.TextIOWrapper(out, encoding="utf-8", newline="", write_through=True)
+    try:
+        writer = csv.DictWriter(text, FIELDS)
+        writer.writeheader()
+        for chunk in chunks:
+            writer.writerows({**{field: _csv_cell(value) for field, value in row.items()}, "read": bool(row["read"])}
+                             for row in chunk)
+    finally:
+        text.detach()
+
+
+def _write_jsonl(chunks, out):
+    for chunk in chunks:
+        out.write("".join(json.dumps({**row, "read": bool(row["read"])}, ensure_ascii=False) + "\n"
+                          for row in chunk).encode("utf-8"))
+
+
+def _write_parquet(chunks, out):
+    pyarrow = _pyarrow()
+    if pyarrow is None:
+        raise RuntimeError("Parquet export needs pyarrow (pip install pyarrow)")
+    schema = pyarrow.schema([
+        ("id", pyarrow.int64()),
+        ("name", pyarrow.string()),
+        ("email", pyarrow.string()),
+        ("message", pyarrow.string()),
+        ("timestamp", pyarrow.string()),
+        ("read", pyarrow.bool_()),
+    ])
+    with pyarrow.parquet.ParquetWriter(out, schema) as writer:
+        for chunk in chunks:
+            columns = {field: [row[field] for row in chunk] for field in FIELDS}
+            columns["read"] = [bool(read) for read in columns["read"]]
+            writer.write_table(pyarrow.Table.from_pydict(columns, schema=schema))
+
+
+class ExportTooLarge(Exception):
+    """Raised when an export outgrows its LimitedBuffer"""
+
+
+class LimitedBuffer(io.BytesIO):
+    """In-memory output that refuses to grow past max_bytes"""
+
+    def __init__(self, max_bytes):
+        super().__init__()
+        self.max_bytes = max_bytes
+
+    def write(self, data):
+        if self.tell() + len(data) > self.max_bytes:
+            raise ExportTooLarge(f"export is larger than {self.max_bytes} bytes")
+        return super().write(data)
+
+
+WRITERS = {"csv": _write_csv, "jsonl": _write_jsonl, "parquet": _write_parquet}
+
+
+# Function to export messages to an open binary file
+def export_messages(out, fmt="csv", since=None, until=None, chunk_size=CHUNK_SIZE, store=message_store):
+    """Write the messages between since and until (inclusive) to out; return how many"""
+    count = 0
+
+    def chunks():
+        nonlocal count
+        bounds = timestamp_bound(since), timestamp_bound(until, end=True)
+        for chunk in archive.iter_messages(*bounds, chunk_size, store):
+            count += len(chunk)
+            yield chunk
+
+    WRITERS[fmt](chunks(), out)
+    return count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export contact messages as CSV, JSON Lines or Parquet")
+    parser.add_argument("-o", "--output", help="file to write (default: standard output)")
+    parser.add_argument("--format", choices=list(FORMATS), help="output format (default: from the file suffix, else csv)")
+    parser.add_argument("--since", help="first day or timestamp to include, e.g. 2025-01-01")
+    parser.add_argument("--until", help="last day or timestamp to include, e.g. 2025-03-31")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="messages read per query")
+    args = parser.parse_args(argv)
+
+    fmt = args.format
+    if fmt is None:
+        suffix = Path(args.output).suffix.lower() if args.output else ""
+        fmt = next((name for name, (_, fmt_suffix) in FORMATS.items() if fmt_suffix == suffix), "csv")
+    if fmt not in available_formats():
+        parser.error("Parquet export needs pyarrow (pip install pyarrow)")
+    try:
+        since, until = timestamp_bound(args.since), timestamp_bound(args.until, end=True)
+    except ValueError as e:
+        parser.error(f"invalid date: {e}")
+
+    if args.output:
+        with open(args.output, "wb") as out:
+            count = export_messages(out, fmt, since, until, args.chunk_size)
+        print(f"exported {count} messages to {args.output}", file=sys.stderr)
+    else:
+        count = export_messages(sys.stdout.buffer, fmt, since, until, args.chunk_size)
+        sys.stdout.buffer.flush()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
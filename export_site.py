@@ -0,0 +1,328 @@
+"""Export the portfolio as a static HTML/CSS bundle.
+
+Renders the same content and HTML fragments as app.py into dist/, with
+optimized images and content-fingerprinted asset names, so the page can be
+served by any static file server. Only the contact form stays dynamic: it
+posts to /api/contact, which static_server.py implements.
+
+    python export_site.py                 # writes dist/
+    python export_site.py --theme Green --out public
+"""
+import argparse
+import hashlib
+import html
+import shutil
+import sys
+from pathlib import Path
+
+import build_assets
+import compress_assets
+import fragments
+import styles
+from assets import IMAGES_DIR, VARIANTS_DIR, column_width, variant_manifest
+from content import PAGE_IMAGES, experience_image, load_content, project_image
+
+DEFAULT_OUT_DIR = Path(__file__).parent / "dist"
+# Written into every export, so a later export knows the directory is its own to replace
+EXPORT_MARKER = ".portfolio-export"
+
+# Layout rules standing in for Streamlit's columns and widgets
+EXPORT_CSS = """
+body { margin: 0; }
+.stApp { min-height: 100vh; }
+.page { max-width: 1200px; margin: 0 auto; padding: 2rem 1.5rem; }
+.columns { display: flex; gap: 1.5rem; }
+.columns > .column { min-width: 0; }
+figure { margin: 0 0 1rem 0; }
+figure img { width: 100%; height: auto; }
+figcaption { text-align: center; font-size: 0.875rem; opacity: 0.6; }
+.contact-form label { display: block; margin-top: 1rem; }
+.contact-form input, .contact-form textarea { width: 100%; padding: 0.5rem; box-sizing: border-box; }
+.contact-form button { margin-top: 1rem; }
+@media (max-width: 640px) {
+    .columns { flex-direction: column; }
+}
+"""
+
+CONTACT_SCRIPT = """
+document.getElementById("contact-form").addEventListener("submit", async (event) => {
+    event.preventDefault();
+    const form = event.target;
+    form.querySelectorAll(".form-error").forEach((el) => { el.textContent = ""; });
+    document.getElementById("form-error").textContent = "";
+    document.getElementById("form-success").hidden = true;
+    let result;
+    try {
+        const response = await fetch(form.action, {
+            method: "POST",
+            headers: {"Accept": "application/json"},
+            body: new URLSearchParams(new FormData(form)),
+        });
+        result = await response.json();
+    } catch (error) {
+        // Network failure, or a response that is not the endpoint's JSON
+        result = {ok: false, errors: {form: "Your message could not be sent. Please check your connection and try again."}};
+    }
+    if (result.ok) {
+        form.reset();
+        document.getElementById("form-success").hidden = false;
+    } else {
+        for (const [field, error] of Object.entries(result.errors || {})) {
+            const el = document.getElementById(field + "-error");
+            if (el) { el.textContent = error; }
+        }
+    }
+});
+"""
+
+
+class AssetWriter:
+    """Copies files into the bundle under content-fingerprinted names"""
+
+    def __init__(self, out_dir):
+        self.out_dir = out_dir
+        self.assets_dir = out_dir / "assets"
+        self.assets_dir.mkdir(parents=True, exist_ok=True)
+        self._written = {}
+
+    def add_bytes(self, data, name):
+        """Write data as assets/<stem>.<hash><suffix> and return its URL"""
+        digest = hashlib.sha256(data).hexdigest()[:12]
+        path = Path(name)
+        file_name = f"{path.stem}.{digest}{path.suffix}"
+        if file_name not in self._written:
+            (self.assets_dir / file_name).write_bytes(data)
+            self._written[file_name] = len(data)
+        return f"assets/{file_name}"
+
+    def add_file(self, path):
+        return self.add_bytes(Path(path).read_bytes(), Path(path).name)
+
+
+# Function to render an image, preferring the pre-built variants
+def image_html(assets, page_image):
+    """Return a <figure> for a content.PageImage, or an empty string if the file is missing"""
+    relative_path, caption, fraction, lazy, _ = page_image
+    loading = 'loading="lazy" decoding="async"' if lazy else ""
+    caption_html = f"<figcaption>{html.escape(caption)}</figcaption>" if caption else ""
+    alt = html.escape(caption or relative_path)
+    variants = variant_manifest.variants(relative_path, formats=("avif", "webp"))
+    if variants:
+        sizes = f"(max-width: 640px) 100vw, {round(fraction * 100)}vw"
+        sources = ""
+        for fmt in ("avif", "webp"):
+            srcset = ", ".join(
+                f'{assets.add_file(VARIANTS_DIR / v["file"])} {v["width"]}w' for v in variants if v["format"] == fmt
+            )
+            if srcset:
+                sources += f'<source type="image/{fmt}" srcset="{srcset}" sizes="{sizes}">'
+        fallback = variant_manifest.pick(relative_path, column_width(fraction))
+        src = assets.add_file(VARIANTS_DIR / fallback["file"])
+        return (f'<figure><picture>{sources}<img src="{src}" alt="{alt}" {loading} '
+                f'width="{fallback["width"]}" height="{fallback["height"]}"></picture>{caption_html}</figure>')
+
+    source = IMAGES_DIR / relative_path
+    if not source.exists():
+        return ""
+    return f'<figure><img src="{assets.add_file(source)}" alt="{alt}" {loading}>{caption_html}</figure>'
+
+
+# Function to lay out blocks side by side like st.columns
+def columns(*cells):
+    """Return a flex row; each cell is a (relative width, html) pair"""
+    inner = "".join(f'<div class="column" style="flex: {weight};">{body}</div>' for weight, body in cells)
+    return f'<div class="columns">{inner}</div>'
+
+
+def section_header(title):
+    return f"<div class='section-header'><h2>{title}</h2></div>"
+
+
+# Function to render the whole page body
+def render_body(assets, content):
+    """Return the HTML for every section of the page"""
+    v = content.version
+    parts = []
+
+    # Home and About
+    parts.append('<div class="section" id="home">')
+    parts.append(columns((2, fragments.HERO_HTML),
+                         (1, image_html(assets, PAGE_IMAGES["profile"]))))
+    parts.append(section_header("About Me"))
+    parts.append(columns((1, image_html(assets, PAGE_IMAGES["about"])),
+                         (2, fragments.ABOUT_HTML + fragments.KEY_POINTS_HTML)))
+    parts.append('</div><div class="section-divider"></div>')
+
+    # Skills, experience and accomplishments
+    parts.append('<div class="section" id="skills">')
+    parts.append(section_header("Technical Skills"))
+    for category in content.skill_categories:
+        half = len(category.skills) // 2 + len(category.skills) % 2
+        parts.append(fragments.skill_category(category, v))
+        parts.append(columns(
+            (1, "".join(fragments.skill(s, v) for s in category.skills[:half])),
+            (1, "".join(fragments.skill(s, v) for s in category.skills[half:])),
+        ))
+    parts.append(section_header("Soft Skills"))
+    parts.append(columns(*[
+        (1, "".join(fragments.soft_skill_card(s, v) for s in content.soft_skills[i::3])) for i in range(3)
+    ]))
+    parts.append(section_header("Work Experience"))
+    for exp in content.experience:
+        parts.append(image_html(assets, experience_image(exp)))
+        parts.append(fragments.experience_item(exp, v))
+        parts.append(fragments.experience_points(exp, v))
+    parts.append(section_header("Professional Accomplishments"))
+    parts.append(columns(*[
+        (1, "".join(fragments.accomplishment_card(a, v) for a in content.accomplishments[i::2]))
+        for i in range(2)
+    ]))
+    parts.append('</div><div class="section-divider"></div>')
+
+    # Projects
+    parts.append('<div class="section" id="projects">')
+    parts.append(section_header("Personal Projects"))
+    parts.append(columns(
+        (1, image_html(assets, PAGE_IMAGES["projects"])),
+        (2, """<div class="project-intro fade-in"><p>I have worked on several projects that demonstrate my skills
+            in Python, Machine Learning, Data Analysis, and IoT. Below are some of my key projects:</p></div>"""),
+    ))
+    for i in range(0, len(content.projects), 2):
+        row = content.projects[i:i + 2]
+        parts.append(columns(*[
+            (1, image_html(assets, project_image(p)) + fragments.project_card(p, v)) for p in row
+        ] + [(1, "")] * (2 - len(row))))
+        parts.append("<hr>")
+    parts.append('</div><div class="section-divider"></div>')
+
+    # Education, certifications and languages
+    parts.append('<div class="section" id="education">')
+    parts.append(section_header("Education"))
+    parts.append(image_html(assets, PAGE_IMAGES["education"]))
+    parts.extend(fragments.education_item(e, v) for e in content.education)
+    parts.append(section_header("Certifications &amp; Trainings"))
+    parts.append(columns(*[
+        (1, "".join(fragments.certification_card(c, v) for c in content.certifications[i::2]))
+        for i in range(2)
+    ]))
+    parts.append(section_header("Languages"))
+    parts.append(columns(*[(1, fragments.language_card(lang, v)) for lang in content.languages]))
+    parts.append('</div><div class="section-divider"></div>')
+
+    # Contact
+    parts.append('<div class="section" id="contact">')
+    parts.append(section_header("Contact Me"))
+    parts.append(columns((2, CONTACT_FORM_HTML), (1, CONTACT_INFO_HTML)))
+    parts.append("</div>")
+    parts.append("""<div class="footer"><p>&copy;* 2025 Sivamahendranath Ragimanu | @copy Right 2025</p></div>""")
+    return "\n".join(parts)
+
+
+CONTACT_FORM_HTML = """
+<h3>Send me a message</h3>
+<div id="form-success" class="form-success" hidden>Thank you for your message! I will get back to you soon.</div>
+<div id="form-error" class="form-error"></div>
+<form id="contact-form" class="contact-form" method="post" action="/api/contact">
+    <label class="required-field" for="name">Name</label>
+    <input id="name" name="name" placeholder="Your name">
+    <div id="name-error" class="form-error"></div>
+    <label class="required-field" for="email">Email</label>
+    <input id="email" name="email" type="email" placeholder="Your email">
+    <div id="email-error" class="form-error"></div>
+    <label class="required-field" for="message">Message</label>
+    <textarea id="message" name="message" rows="6" placeholder="Your message"></textarea>
+    <div id="message-error" class="form-error"></div>
+    <button type="submit" class="contact-button">Send Message</button>
+</form>
+"""
+
+CONTACT_INFO_HTML = """
+<h3>📱 Contact Information</h3>
+<h4>📍 Location</h4><p>Anantapur, Andhra Pradesh, India</p>
+<h4>✉️ Email</h4><p>mahendraragimanu2@gmail.com</p>
+<h4>☎️ Phone</h4><p>+91 8106442744</p>
+<h4>🔗 Connect With Me</h4>
+<div class="social-links">
+    <a href="https://www.linkedin.com/in/sivamahendranath-ragimanu-68a94823b/" target="_blank"><i class="fab fa-linkedin fa-2x"></i></a>
+    <a href="https://github.com/Sivamahendranath" target="_blank"><i class="fab fa-github fa-2x"></i></a>
+    <a href="mailto:mahendraragimanu2@gmail.com" target="_blank"><i class="fas fa-envelope fa-2x"></i></a>
+</div>
+"""
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>Sivamahendranath Ragimanu | Portfolio</title>
+<link rel="icon" href="data:image/svg+xml,<svg xmlns=%22http://www.w3.org/2000/svg%22 viewBox=%220 0 100 100%22><text y=%22.9em%22 font-size=%2290%22>👨‍💻</text></svg>">
+<link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0-beta3/css/all.min.css">
+<link rel="stylesheet" href="{css_url}">
+</head>
+<body>
+<div class="stApp"><main class="page">
+{body}
+</main></div>
+<script src="{script_url}" defer></script>
+</body>
+</html>
+"""
+
+
+# Function to make sure an export may replace out_dir
+def check_out_dir(out_dir):
+    """Raise FileExistsError unless out_dir is missing, empty or a previous export"""
+    out_dir = Path(out_dir)
+    if not out_dir.exists():
+        return
+    if not out_dir.is_dir():
+        raise FileExistsError(f"{out_dir} exists and is not a directory")
+    if any(out_dir.iterdir()) and not (out_dir / EXPORT_MARKER).is_file():
+        raise FileExistsError(f"{out_dir} is not empty and does not hold a previous export; "
+                              f"choose another --out or empty it first")
+
+
+# Function to export the whole site
+def export_site(out_dir=DEFAULT_OUT_DIR, theme=styles.DEFAULT_THEME):
+    """Write the static bundle to out_dir and return the path of index.html"""
+    out_dir = Path(out_dir)
+    check_out_dir(out_dir)
+    if out_dir.exists():
+        shutil.rmtree(out_dir)
+    out_dir.mkdir(parents=True)
+    (out_dir / EXPORT_MARKER).write_text("Written by export_site.py; replaced on the next export.\n")
+    assets = AssetWriter(out_dir)
+    content = load_content()
+
+    css = styles.portfolio_stylesheet(theme).css + styles.minify_css(EXPORT_CSS)
+    css_url = assets.add_bytes(css.encode("utf-8"), "site.css")
+    script_url = assets.add_bytes(CONTACT_SCRIPT.encode("utf-8"), "contact.js")
+    body = render_body(assets, content)
+
+    index_path = out_dir / "index.html"
+    index_path.write_text(PAGE_TEMPLATE.format(css_url=css_url, script_url=script_url, body=body), encoding="utf-8")
+    return index_path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export the portfolio as a static site")
+    parser.add_argument("--out", default=str(DEFAULT_OUT_DIR), help="output directory (replaced only if empty or a previous export)")
+    parser.add_argument("--theme", default=styles.DEFAULT_THEME, choices=list(styles.THEME_COLORS))
+    parser.add_argument("--skip-image-build", action="store_true", help="reuse existing image variants as they are")
+    args = parser.parse_args(argv)
+
+    try:
+        check_out_dir(args.out)
+    except FileExistsError as e:
+        parser.error(str(e))
+    if not args.skip_image_build:
+        build_assets.main([])
+    index_path = export_site(args.out, args.theme)
+    compress_assets.compress_tree(args.out)
+    total = sum(p.stat().st_size for p in Path(args.out).rglob("*") if p.is_file())
+    print(f"exported {index_path} ({total / 1024:.0f} KB in total)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,325 @@
+"""Pre-rendered HTML for the repeated cards on the page.
+
+Each card is rendered once per content version and the resulting
+string is shared by every session, so reruns only look the HTML up instead of
+rebuilding large f-strings. Entries for older content versions are dropped as
+soon as a new version of content.json is seen.
+"""
+import re
+import sys
+import threading
+
+
+class FragmentCache:
+    """Process-wide cache of rendered HTML strings with hit/miss counters"""
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+        self._version = None
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_render(self, kind, key, version, render):
+        """Return the cached HTML for a card, calling render() on a miss"""
+        cache_key = (kind, key, version)
+        html = self._entries.get(cache_key)
+        if html is not None:
+            with self._lock:
+                self.hits += 1
+            return html
+
+        html = render()
+        with self._lock:
+            self.misses += 1
+            if version != self._version:
+                # content.json changed; nothing rendered from the old version is reusable
+                self._entries = {k: v for k, v in self._entries.items() if k[2] == version}
+                self._version = version
+            self._entries[cache_key] = html
+        return html
+
+    def clear(self):
+        with self._lock:
+            self._entries = {}
+
+    def size_bytes(self):
+        """Return the memory held by the cached HTML strings"""
+        with self._lock:
+            return sum(sys.getsizeof(html) for html in self._entries.values())
+
+    def stats(self):
+        """Return hit/miss counters, the hit rate and the number of cached fragments"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "fragments": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+fragment_cache = FragmentCache()
+
+
+# Function to build the id a card can be linked to
+def anchor(kind, name):
+    """Return the HTML id of a card, such as project-smart-docs for the project "Smart Docs"."""
+    return f"{kind}-{re.sub(r'[^a-z0-9]+', '-', name.lower()).strip('-')}"
+
+
+# Static hero and About Me blocks; shared with the static site export
+HERO_HTML = """
+<div class="hero-section fade-in">
+    <h1>Sivamahendranath <span class="highlight">Ragimanu</span></h1>
+    <h3>🎓 Computer Science Graduate | Python Developer | Data Analyst | AI | Machine Learning Enthusiast</h3>
+    <p class="lead-text">Aspiring AI & Data Professional with hands-on experience in Python, Machine Learning, LLMs (GPT-4), and RAG pipelines. Interned at C-DAC Hyderabad, where I built AI-powered knowledge graphs, semantic search tools, and document analysis apps using Streamlit, SQLite3, and NetworkX.
+Strong in data visualization, NLP, and automated data processing. Prior internship at Oppo Mobiles enhanced my skills in testing, collaboration, and debugging.
+
+I'm driven to build smart, scalable, and impactful AI solutions that turn raw data into insights. Open to roles in AI Engineering, Data Science, or Python Development.</p>
+</div>
+"""
+
+ABOUT_HTML = """
+<div class="about-text fade-in">
+    <p>Aspiring AI & Data Science professional skilled in Python, NLP, LLMs (GPT-4, LLaMA2), RAG pipelines, and Streamlit. Experienced in building offline-first AI applications, including document chatbots, knowledge graph visualizers, and semantic search tools.
+
+Interned at C-DAC Hyderabad, developing AI-powered solutions focused on data privacy and interactive insights. Gained hands-on testing and debugging experience at Oppo Mobiles India.
+
+Core skills: Python | GPT-4 | LangChain | Whisper | Ollama | NLP | SQLite3 | NetworkX | Data Visualization | OpenCV
+
+Open to roles in AI Engineering, Data Science, and Python Development.
+I am passionate about building scalable AI-powered solutions that emphasize data privacy, interactive user experience, and real-world impact.<br>
+Seeking opportunities in: AI Engineering, Data Science, Python Development, NLP Research. </p>
+</div>
+"""
+
+KEY_POINTS_HTML = """
+<div class="key-points">
+    <div class="key-point"><i class="fas fa-map-marker-alt"></i> Anantapur,  Andhra Pradesh</div>
+    <div class="key-point"><i class="fas fa-phone"></i> 8106442744</div>
+    <div class="key-point"><i class="fas fa-envelope"></i> mahendraragimanu2@gmail.com</div>
+</div>
+"""
+
+
+# Function to render a skill category heading
+def _skill_category_html(category):
+    return f"""
+<div class="skill-category" id="{anchor('skills', category.name)}">
+    <h3><i class="{category.icon} skill-category-icon"></i>{category.name}</h3>
+</div>
+"""
+
+
+# Function to render one skill name
+def _skill_html(skill):
+    return f"""
+<div class="skill-container fade-in">
+    <div class="skill-name">{skill}</div>
+</div>
+"""
+
+
+# Function to render one soft skill card
+def _soft_skill_html(skill):
+    return f"""
+<div class="soft-skill-card fade-in">
+    <i class="fas fa-check-circle"></i>
+    <h4>{skill}</h4>
+</div>
+"""
+
+
+# Function to render a work experience timeline entry
+def _experience_html(exp):
+    return f"""
+<div class="timeline fade-in" id="{anchor('experience', exp.role)}">
+    <div class="timeline-item">
+        <div class="timeline-dot"></div>
+        <div class="timeline-date">{exp.duration}</div>
+        <div class="timeline-content custom-card">
+            <h3>{exp.role}</h3>
+            <h4>{exp.organization}</h4>
+        </div>
+    </div>
+</div>
+"""
+
+
+# Function to render the bullet points under a work experience entry
+def _experience_points_html(exp):
+    points = "".join(f"<li>{point}</li>" for point in exp.points)
+    return f"""
+<ul style="margin-top: -20px; margin-left: 40px;">
+    {points}
+</ul>
+"""
+
+
+# Function to render one accomplishment card
+def _accomplishment_html(acc):
+    return f"""
+<div class="accomplishment-card fade-in" id="{anchor('accomplishment', acc.title)}">
+    <div class="accomplishment-icon"><i class="{acc.icon}"></i></div>
+    <div class="accomplishment-content">
+        <h4>{acc.title}</h4>
+        <p>{acc.detail}</p>
+    </div>
+</div>
+"""
+
+
+# Function to render one language card
+def _language_html(lang):
+    return f"""
+<div class="language-card fade-in">
+    <div class="language-icon">
+        <i class="{lang.icon}"></i>
+    </div>
+    <h4>{lang.name}</h4>
+    <p>{lang.proficiency}</p>
+</div>
+"""
+
+
+# Function to render one project card
+def _project_card_html(project):
+    features = "".join(f"<li>{feature}</li>" for feature in project.features)
+    badges = "".join(f'<span class="tech-badge">{tech}</span>' for tech in project.tech_stack)
+    return f"""
+<div class="project-details fade-in" id="{anchor('project', project.title)}">
+    <h3>{project.title}</h3>
+    <div class="project-meta">
+        <div><i class="far fa-calendar-alt"></i> {project.date}</div>
+        <div><i class="fas fa-building"></i> {project.org}</div>
+        <div><i class="fas fa-tag"></i> {project.type}</div>
+    </div>
+    <p class="project-description">{project.description}</p>
+    <h4>Key Features:</h4>
+    <ul class="feature-list">
+        {features}
+    </ul>
+    <div class="tech-stack">
+        <h4>Tech Stack:</h4>
+        <div>
+            {badges}
+        </div>
+    </div>
+    <div style="margin-top: 15px;">
+        <a href="{project.github}" target="_blank" style="color: #5846f6;">
+            <i class="fab fa-github"></i> View on GitHub
+        </a>
+    </div>
+</div>
+"""
+
+
+# Function to render one education timeline entry
+def _education_item_html(edu):
+    return f"""
+<div class="timeline-item fade-in" id="{anchor('education', edu.degree)}">
+    <div class="timeline-dot"></div>
+    <div class="timeline-date">{edu.duration}</div>
+    <div class="timeline-content custom-card">
+        <h3>{edu.degree}</h3>
+        <h4>{edu.institution}, {edu.location}</h4>
+        <div class="education-grade">
+            <span><i class="fas fa-star"></i> {edu.grade}</span>
+        </div>
+        <div class="key-courses" style="margin-top: 10px;">
+            <h5>Key Courses:</h5>
+            <p>{", ".join(edu.courses)}</p>
+        </div>
+    </div>
+</div>
+"""
+
+
+# Function to render one certification card
+def _certification_card_html(cert):
+    return f"""
+<div class="custom-card fade-in" id="{anchor('certification', cert.title)}">
+    <h4>{cert.title}</h4>
+    <p><i class="fas fa-certificate" style="color: #5846f6;"></i> {cert.issuer} | {cert.date}</p>
+</div>
+"""
+
+
+def project_card(project, version):
+    """Return the cached HTML for a project card"""
+    return fragment_cache.get_or_render("project", project.title, version,
+                                        lambda: _project_card_html(project))
+
+
+def education_item(edu, version):
+    """Return the cached HTML for an education timeline entry"""
+    return fragment_cache.get_or_render("education", edu.degree, version,
+                                        lambda: _education_item_html(edu))
+
+
+def certification_card(cert, version):
+    """Return the cached HTML for a certification card"""
+    return fragment_cache.get_or_render("certification", cert.title, version,
+                                        lambda: _certification_card_html(cert))
+
+
+def skill_category(category, version):
+    """Return the cached HTML for a skill category heading"""
+    return fragment_cache.get_or_render("skill_category", category.name, version,
+                                        lambda: _skill_category_html(category))
+
+
+def skill(name, version):
+    """Return the cached HTML for one skill name"""
+    return fragment_cache.get_or_render("skill", name, version, lambda: _skill_html(name))
+
+
+def soft_skill_card(name, version):
+    """Return the cached HTML for a soft skill card"""
+    return fragment_cache.get_or_render("soft_skill", name, version, lambda: _soft_skill_html(name))
+
+
+def experience_item(exp, version):
+    """Return the cached HTML for a work experience timeline entry"""
+    return fragment_cache.get_or_render("experience", exp.role, version,
+                                        lambda: _experience_html(exp))
+
+
+def experience_points(exp, version):
+    """Return the cached HTML for the bullet points of a work experience entry"""
+    return fragment_cache.get_or_render("experience_points", exp.role, version,
+                                        lambda: _experience_points_html(exp))
+
+
+def accomplishment_card(acc, version):
+    """Return the cached HTML for an accomplishment card"""
+    return fragment_cache.get_or_render("accomplishment", acc.title, version,
+                                        lambda: _accomplishment_html(acc))
+
+
+def language_card(lang, version):
+    """Return the cached HTML for a language card"""
+    return fragment_cache.get_or_render("language", lang.name, version,
+                                        lambda: _language_html(lang))
+
+
+# Function to render every card up front
+def prerender(content):
+    """Render and cache every card for one content version; return how many there are"""
+    version = content.version
+    rendered = []
+    for category in content.skill_categories:
+        rendered.append(skill_category(category, version))
+        rendered.extend(skill(name, version) for name in category.skills)
+    rendered.extend(soft_skill_card(name, version) for name in content.soft_skills)
+    for exp in content.experience:
+        rendered.append(experience_item(exp, version))
+        rendered.append(experience_points(exp, version))
+    rendered.extend(accomplishment_card(acc, version) for acc in content.accomplishments)
+    rendered.extend(language_card(lang, version) for lang in content.languages)
+    rendered.extend(project_card(project, version) for project in content.projects)
+    rendered.extend(education_item(edu, version) for edu in content.education)
+    rendered.extend(certification_card(cert, version) for cert in content.certifications)
+    return len(rendered)
@@ -0,0 +1,48 @@
+"""Memory report for one session and for the state shared by every session.
+
+Content, display-sized images, placeholders, compiled CSS and rendered HTML live
+once per process in the modules that own them; a session only holds its
+widget values (the theme and the contact form fields). The ?debug=1 sidebar
+shows both sides so that stays verifiable.
+"""
+import sys
+from types import MappingProxyType
+
+from assets import image_cache, placeholder_png
+from content import load_content
+from fragments import fragment_cache
+
+
+# Function to measure an object together with everything it contains
+def deep_sizeof(obj, seen=None):
+    """Return the size in bytes of obj and the containers, strings and records it references"""
+    if seen is None:
+        seen = set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, (dict, MappingProxyType)):
+        size += sum(deep_sizeof(key, seen) + deep_sizeof(value, seen) for key, value in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_sizeof(item, seen) for item in obj)
+    return size
+
+
+# Function to report what one session keeps
+def session_report(session_state):
+    """Return the bytes held per session state key and in total"""
+    keys = {str(key): deep_sizeof(value) for key, value in session_state.items()}
+    return {"keys": keys, "total_bytes": sum(keys.values())}
+
+
+# Function to report what every session shares
+def shared_report():
+    """Return the bytes held once per process by the shared caches"""
+    placeholders = placeholder_png.cache_info().currsize
+    return {
+        "content_bytes": deep_sizeof(load_content()),
+        "image_bytes": image_cache.size_bytes(),
+        "fragment_html_bytes": fragment_cache.size_bytes(),
+        "placeholders_cached": placeholders,
+    }
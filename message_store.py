@@ -0,0 +1,440 @@
+"""Contact message storage backed by SQLite in WAL mode.
+
+Each submission is a single-row INSERT, so saving a message no longer depends
+on how many messages already exist. WAL mode lets readers run alongside the
+writer, and SQLite's own locking keeps concurrent Streamlit sessions (or
+several app processes sharing the data folder) from losing each other's
+writes. Messages from the old data/contact_messages.json are imported once.
+
+The same database holds the email outbox: a message and its pending
+notification are committed together, and notifications.py drains the outbox
+in the background.
+
+For the owner's inbox, messages are paged newest first by id, unread ones
+sit in a partial index and an FTS5 index (kept in sync by triggers) serves
+full-text search, so none of it loads the whole table. Exports read
+messages in timestamp order, in fixed-size chunks. archive.py moves old
+messages out into compressed segments, so the tables only hold recent ones.
+"""
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+DATA_DIR = Path(os.getenv("PORTFOLIO_DATA_DIR", Path(__file__).parent / "data"))
+DB_PATH = DATA_DIR / "messages.db"
+LEGACY_JSON_PATH = DATA_DIR / "contact_messages.json"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS messages (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    email TEXT NOT NULL,
+    message TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    read INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    message_id INTEGER NOT NULL REFERENCES messages (id),
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL,
+    last_error TEXT,
+    created_at REAL NOT NULL,
+    sent_at REAL
+);
+CREATE INDEX IF NOT EXISTS outbox_due ON outbox (status, next_attempt_at);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS messages_unread ON messages (id) WHERE read = 0;
+CREATE INDEX IF NOT EXISTS messages_timestamp ON messages (timestamp);
+"""
+
+# Full-text index over name/email/message, kept in sync by triggers. Only
+# created when SQLite was built with FTS5; search falls back to LIKE otherwise.
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS messages_fts USING fts5(
+    name, email, message, content='messages', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS messages_fts_insert AFTER INSERT ON messages BEGIN
+    INSERT INTO messages_fts (rowid, name, email, message) VALUES (new.id, new.name, new.email, new.message);
+END;
+CREATE TRIGGER IF NOT EXISTS messages_fts_delete AFTER DELETE ON messages BEGIN
+    INSERT INTO messages_fts (messages_fts, rowid, name, email, message)
+    VALUES ('delete', old.id, old.name, old.email, old.message);
+END;
+CREATE TRIGGER IF NOT EXISTS messages_fts_update AFTER UPDATE OF name, email, message ON messages BEGIN
+    INSERT INTO messages_fts (messages_fts, rowid, name, email, message)
+    VALUES ('delete', old.id, old.name, old.email, old.message);
+    INSERT INTO messages_fts (rowid, name, email, message) VALUES (new.id, new.name, new.email, new.message);
+END;
+"""
+
+MESSAGE_COLUMNS = "messages.id, messages.name, messages.email, messages.message, messages.timestamp, messages.read"
+
+
+# Email validation function
+def is_valid_email(email):
+    """Validate email format using regex"""
+    email_pattern = r'^[\w\.-]+@[\w\.-]+\.\w+$'
+    return bool(re.match(email_pattern, email))
+
+
+# Function to validate a contact form submission
+def validate_message(name, email, message):
+    """Return a dict of field name -> error message; empty when the submission is valid"""
+    errors = {}
+    if not name.strip():
+        errors["name"] = "Please enter your name."
+    if not email.strip():
+        errors["email"] = "Please enter your email."
+    elif not is_valid_email(email):
+        errors["email"] = "Please enter a valid email address."
+    if not message.strip():
+        errors["message"] = "Please enter your message."
+    return errors
+
+
+class MessageStore:
+    """Store of live contact messages shared by every session in the process"""
+
+    def __init__(self, db_path=DB_PATH, legacy_json_path=LEGACY_JSON_PATH):
+        self.db_path = Path(db_path)
+        self.legacy_json_path = Path(legacy_json_path)
+        self._lock = threading.Lock()
+        self._conn = None
+        self.full_text_search = False
+
+    def _connection(self):
+        """Open the database on first use, creating the schema and migrating legacy data"""
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=FULL")
+            # Wait for other processes holding the write lock instead of failing
+            conn.execute("PRAGMA busy_timeout=5000")
+            conn.executescript(SCHEMA)
+            self._conn = conn
+            self._create_fts()
+            self._migrate_legacy_json()
+        return self._conn
+
+    def _create_fts(self):
+        """Create the full-text index if SQLite supports it, indexing existing rows once"""
+        conn = self._conn
+        try:
+            conn.executescript(FTS_SCHEMA)
+        except sqlite3.OperationalError:
+            return  # No FTS5 in this SQLite build
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if not conn.execute("SELECT 1 FROM meta WHERE key = 'fts_built'").fetchone():
+                conn.execute("INSERT INTO messages_fts (messages_fts) VALUES ('rebuild')")
+                conn.execute("INSERT INTO meta (key, value) VALUES ('fts_built', ?)",
+                             (time.strftime("%Y-%m-%d %H:%M:%S"),))
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        self.full_text_search = True
+
+    def _migrate_legacy_json(self):
+        """Import data/contact_messages.json once, then rename it out of the way"""
+        if not self.legacy_json_path.exists():
+            return
+        conn = self._conn
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            done = conn.execute("SELECT 1 FROM meta WHERE key = 'legacy_json_migrated'").fetchone()
+            if not done:
+                try:
+                    with open(self.legacy_json_path, "r") as f:
+                        messages = json.load(f)
+                except json.JSONDecodeError:
+                    messages = []
+                conn.executemany(
+                    "INSERT INTO messages (name, email, message, timestamp, read) VALUES (?, ?, ?, ?, ?)",
+                    [
+                        (m.get("name", ""), m.get("email", ""), m.get("message", ""),
+                         m.get("timestamp", ""), int(bool(m.get("read", False))))
+                        for m in messages
+                    ],
+                )
+                conn.execute(
+                    "INSERT INTO meta (key, value) VALUES ('legacy_json_migrated', ?)",
+                    (time.strftime("%Y-%m-%d %H:%M:%S"),),
+                )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        # Keep the original file around for reference, but never import it twice
+        try:
+            os.replace(self.legacy_json_path, self.legacy_json_path.with_name(self.legacy_json_path.name + ".migrated"))
+        except FileNotFoundError:
+            pass  # Another process got there first
+
+    def add(self, name, email, message, timestamp=None, notify=False):
+        """Append one message and return its id
+
+        With notify=True an outbox entry is committed in the same transaction,
+        so a stored message is never left without its pending notification.
+        """
+        if timestamp is None:
+            timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                message_id = conn.execute(
+                    "INSERT INTO messages (name, email, message, timestamp, read) VALUES (?, ?, ?, ?, 0)",
+                    (name, email, message, timestamp),
+                ).lastrowid
+                if notify:
+                    now = time.time()
+                    conn.execute(
+                        "INSERT INTO outbox (message_id, next_attempt_at, created_at) VALUES (?, ?, ?)",
+                        (message_id, now, now),
+                    )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            return message_id
+
+    def claim_notifications(self, limit=50, lease_seconds=120):
+        """Lease due outbox entries to the caller and return them with their message
+
+        Claimed entries move to 'sending'. If the claiming worker dies, the
+        lease runs out and the entries become due again.
+        """
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                rows = conn.execute(
+                    """
+                    SELECT outbox.id, outbox.message_id, outbox.attempts, outbox.created_at,
+                           messages.name, messages.email, messages.message, messages.timestamp
+                    FROM outbox JOIN messages ON messages.id = outbox.message_id
+                    WHERE outbox.status IN ('pending', 'sending') AND outbox.next_attempt_at <= ?
+                    ORDER BY outbox.next_attempt_at
+                    LIMIT ?
+                    """,
+                    (now, limit),
+                ).fetchall()
+                conn.executemany(
+                    "UPDATE outbox SET status = 'sending', next_attempt_at = ? WHERE id = ?",
+                    [(now + lease_seconds, row["id"]) for row in rows],
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return [dict(row) for row in rows]
+
+    def due_notification_summary(self):
+        """Return (count, oldest created_at) of outbox entries that could be claimed now"""
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT COUNT(*), MIN(created_at) FROM outbox "
+                "WHERE status IN ('pending', 'sending') AND next_attempt_at <= ?",
+                (time.time(),),
+            ).fetchone()
+        return row[0], row[1]
+
+    def next_notification_due(self):
+        """Return when the earliest pending outbox entry is due, or None if there is none"""
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT MIN(next_attempt_at) FROM outbox WHERE status IN ('pending', 'sending')"
+            ).fetchone()
+        return row[0]
+
+    def mark_notifications_sent(self, outbox_ids):
+        """Record that the given outbox entries were delivered"""
+        now = time.time()
+        with self._lock:
+            self._connection().executemany(
+                "UPDATE outbox SET status = 'sent', sent_at = ?, last_error = NULL WHERE id = ?",
+                [(now, outbox_id) for outbox_id in outbox_ids],
+            )
+
+    def mark_notification_failed(self, outbox_id, error, retry_at=None):
+        """Schedule a retry at retry_at, or move the entry to the dead-letter list if None"""
+        with self._lock:
+            if retry_at is None:
+                self._connection().execute(
+                    "UPDATE outbox SET status = 'dead', attempts = attempts + 1, last_error = ? WHERE id = ?",
+                    (error, outbox_id),
+                )
+            else:
+                self._connection().execute(
+                    "UPDATE outbox SET status = 'pending', attempts = attempts + 1, last_error = ?, "
+                    "next_attempt_at = ? WHERE id = ?",
+                    (error, retry_at, outbox_id),
+                )
+
+    def dead_letters(self):
+        """Return outbox entries that exhausted their retries"""
+        with self._lock:
+            rows = self._connection().execute(
+                "SELECT id, message_id, attempts, last_error, created_at FROM outbox "
+                "WHERE status = 'dead' ORDER BY id"
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def requeue_dead_letters(self):
+        """Give every dead-lettered entry a fresh set of retries; returns how many"""
+        with self._lock:
+            return self._connection().execute(
+                "UPDATE outbox SET status = 'pending', attempts = 0, next_attempt_at = ? WHERE status = 'dead'",
+                (time.time(),),
+            ).rowcount
+
+    def page(self, before_id=None, limit=25, unread_only=False, query=None):
+        """Return up to `limit` messages newest first, starting below before_id
+
+        Paging is by id (keyset), so every page costs the same however deep
+        into the inbox it is. `query` matches name, email and message; each
+        word is matched as a prefix.
+        """
+        conditions, params = [], []
+        if before_id is not None:
+            conditions.append("messages.id < ?")
+            params.append(before_id)
+        if unread_only:
+            conditions.append("messages.read = 0")
+        with self._lock:
+            conn = self._connection()
+            source = "messages"
+            words = (query or "").split()
+            if words and self.full_text_search:
+                source = "messages_fts JOIN messages ON messages.id = messages_fts.rowid"
+                conditions.append("messages_fts MATCH ?")
+                params.append(" ".join('"{}"*'.format(word.replace('"', '""')) for word in words))
+            else:
+                for word in words:
+                    pattern = "%" + re.sub(r"([\\%_])", r"\\\1", word) + "%"
+                    conditions.append("(messages.name LIKE ? ESCAPE '\\' OR messages.email LIKE ? ESCAPE '\\' "
+                                      "OR messages.message LIKE ? ESCAPE '\\')")
+                    params.extend((pattern, pattern, pattern))
+            where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+            rows = conn.execute(
+                f"SELECT {MESSAGE_COLUMNS} FROM {source} {where} ORDER BY messages.id DESC LIMIT ?",
+                (*params, limit),
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def iter_messages(self, since=None, until=None, chunk_size=1000):
+        """Yield lists of up to chunk_size messages in timestamp order
+
+        since and until are inclusive "%Y-%m-%d %H:%M:%S" bounds. Each chunk is
+        a separate keyset query, so memory stays flat however many messages
+        match and writers are never blocked for the whole export.
+        """
+        conditions, params = [], []
+        if since is not None:
+            conditions.append("timestamp >= ?")
+            params.append(since)
+        if until is not None:
+            conditions.append("timestamp <= ?")
+            params.append(until)
+        after = None
+        while True:
+            keyset = ["(timestamp, id) > (?, ?)"] if after else []
+            where = " AND ".join(conditions + keyset)
+            with self._lock:
+                rows = self._connection().execute(
+                    f"SELECT {MESSAGE_COLUMNS} FROM messages {'WHERE ' + where if where else ''} "
+                    "ORDER BY timestamp, id LIMIT ?",
+                    (*params, *(after or ()), chunk_size),
+                ).fetchall()
+            if not rows:
+                return
+            yield [dict(row) for row in rows]
+            after = (rows[-1]["timestamp"], rows[-1]["id"])
+
+    def archivable_messages(self, before, limit=1000):
+        """Return up to `limit` of the oldest messages stored before `before`, in timestamp order
+
+        Messages whose notification is still pending or dead-lettered are left
+        out; the outbox needs them until the owner has been told.
+        """
+        with self._lock:
+            rows = self._connection().execute(
+                f"SELECT {MESSAGE_COLUMNS} FROM messages WHERE timestamp < ? AND NOT EXISTS ("
+                "SELECT 1 FROM outbox WHERE outbox.message_id = messages.id AND outbox.status != 'sent') "
+                "ORDER BY timestamp, id LIMIT ?",
+                (before, limit),
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def remove_messages(self, message_ids, sealed_segment=None):
+        """Delete messages and their delivered outbox entries in one transaction
+
+        With sealed_segment, the archive segment now holding them is recorded
+        in the same transaction (see segment_sealed).
+        """
+        params = [(message_id,) for message_id in message_ids]
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.executemany("DELETE FROM outbox WHERE message_id = ? AND status = 'sent'", params)
+                conn.executemany("DELETE FROM messages WHERE id = ?", params)
+                if sealed_segment is not None:
+                    conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                                 (f"segment:{sealed_segment}", time.strftime("%Y-%m-%d %H:%M:%S")))
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+    def segment_sealed(self, name):
+        """Return True if the archive segment `name` was recorded by remove_messages"""
+        with self._lock:
+            return self._connection().execute(
+                "SELECT 1 FROM meta WHERE key = ?", (f"segment:{name}",)
+            ).fetchone() is not None
+
+    def checkpoint(self):
+        """Copy the write-ahead log into the database and truncate it"""
+        with self._lock:
+            self._connection().execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def set_read(self, message_id, read=True):
+        """Mark one message read or unread; returns False if there is no such message"""
+        with self._lock:
+            return self._connection().execute(
+                "UPDATE messages SET read = ? WHERE id = ?", (int(read), message_id)
+            ).rowcount == 1
+
+    def unread_count(self):
+        """Return the number of unread messages"""
+        with self._lock:
+            return self._connection().execute("SELECT COUNT(*) FROM messages WHERE read = 0").fetchone()[0]
+
+    def count(self):
+        """Return the number of stored messages"""
+        with self._lock:
+            return self._connection().execute("SELECT COUNT(*) FROM messages").fetchone()[0]
+
+    def close(self):
+        """Close the underlying connection"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+message_store = MessageStore()
@@ -0,0 +1,335 @@
+"""Background delivery of contact-form email notifications.
+
+The form handler only commits the message and its outbox entry (see
+message_store.py); a daemon thread drains the outbox over one kept-alive SMTP
+connection, retrying failures with exponential backoff and moving entries
+that keep failing to a dead-letter list.
+
+SMTP settings come from the same environment variables the app always used,
+plus SMTP_STARTTLS (default "1") so the worker can be pointed at a local
+stand-in server such as smtp_sink.py.
+
+In digest mode (NOTIFY_DIGEST_WINDOW > 0) the worker coalesces everything that
+arrives within the window, or up to NOTIFY_DIGEST_MAX messages, into a single
+email, which keeps bursts of submissions from turning into bursts of SMTP
+sessions.
+"""
+import html
+import logging
+import os
+import random
+import smtplib
+import statistics
+import threading
+import time
+from collections import deque
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+
+from message_store import message_store
+
+logger = logging.getLogger(__name__)
+
+MAX_ATTEMPTS = int(os.getenv("NOTIFY_MAX_ATTEMPTS", "6"))
+BACKOFF_BASE_SECONDS = 30
+BACKOFF_MAX_SECONDS = 3600
+# How long an unused SMTP connection is kept open before it is closed
+SMTP_IDLE_SECONDS = 60
+# Upper bound on how long the worker sleeps between outbox checks
+POLL_SECONDS = 15
+# Digest mode: seconds to collect messages before sending (0 disables digests)
+DIGEST_WINDOW_SECONDS = float(os.getenv("NOTIFY_DIGEST_WINDOW", "0"))
+# Digest mode: send as soon as this many messages are waiting
+DIGEST_MAX_MESSAGES = int(os.getenv("NOTIFY_DIGEST_MAX", "50"))
+
+
+# Function to read SMTP settings from the environment
+def smtp_settings():
+    """Return the SMTP settings, read from environment variables"""
+    return {
+        "server": os.getenv("SMTP_SERVER", "smtp.gmail.com"),
+        "port": int(os.getenv("SMTP_PORT", "587")),
+        "starttls": os.getenv("SMTP_STARTTLS", "1") != "0",
+        "sender": os.getenv("SENDER_EMAIL"),
+        "password": os.getenv("SENDER_PASSWORD"),
+        "recipient": os.getenv("RECIPIENT_EMAIL", "mahendraragimanu2@gmail.com"),
+    }
+
+
+# Function to check whether notifications can be sent at all
+def is_configured():
+    """Return True when a sender and recipient address are configured"""
+    settings = smtp_settings()
+    return bool(settings["sender"] and settings["recipient"])
+
+
+# Function to build the notification email for one message
+def build_email(entry, settings):
+    """Create the notification email for a stored contact message"""
+    email_message = MIMEMultipart()
+    email_message["From"] = settings["sender"]
+    email_message["To"] = settings["recipient"]
+    email_message["Subject"] = f"New Portfolio Contact from {entry['name']}"
+
+    html_content = f"""
+    <html>
+        <body>
+            <h2>New Contact Message from Your Portfolio</h2>
+            <p><strong>Name:</strong> {html.escape(entry['name'])}</p>
+            <p><strong>Email:</strong> {html.escape(entry['email'])}</p>
+            <p><strong>Message:</strong></p>
+            <p>{html.escape(entry['message'])}</p>
+            <hr>
+            <p><em>This is an automated notification from your portfolio website.</em></p>
+        </body>
+    </html>
+    """
+    email_message.attach(MIMEText(html_content, "html"))
+    return email_message
+
+
+# Function to build one email covering several messages
+def build_digest_email(entries, settings):
+    """Create a single notification email listing several contact messages"""
+    email_message = MIMEMultipart()
+    email_message["From"] = settings["sender"]
+    email_message["To"] = settings["recipient"]
+    email_message["Subject"] = f"{len(entries)} New Portfolio Contacts"
+
+    items = "".join(
+        f"""
+            <h3>{html.escape(entry['name'])} &lt;{html.escape(entry['email'])}&gt;</h3>
+            <p><em>{html.escape(entry['timestamp'])}</em></p>
+            <p>{html.escape(entry['message'])}</p>
+            <hr>"""
+        for entry in entries
+    )
+    html_content = f"""
+    <html>
+        <body>
+            <h2>{len(entries)} New Contact Messages from Your Portfolio</h2>
+            {items}
+            <p><em>This is an automated digest from your portfolio website.</em></p>
+        </body>
+    </html>
+    """
+    email_message.attach(MIMEText(html_content, "html"))
+    return email_message
+
+
+class SMTPConnection:
+    """A single SMTP connection that is reused across sends and reopened on demand"""
+
+    def __init__(self, settings):
+        self.settings = settings
+        self._server = None
+        self._last_used = 0.0
+        self.opened = 0
+
+    def _open(self):
+        server = smtplib.SMTP(self.settings["server"], self.settings["port"], timeout=30)
+        if self.settings["starttls"]:
+            server.starttls()  # Secure the connection
+        if self.settings["password"]:
+            server.login(self.settings["sender"], self.settings["password"])
+        self._server = server
+        self.opened += 1
+
+    def send(self, email_message):
+        """Send one email, reconnecting once if the server dropped the connection"""
+        if self._server is None:
+            self._open()
+        try:
+            self._server.send_message(email_message)
+        except smtplib.SMTPServerDisconnected:
+            self._server = None
+            self._open()
+            self._server.send_message(email_message)
+        self._last_used = time.monotonic()
+
+    def close_if_idle(self):
+        """Close the connection if it has not been used for SMTP_IDLE_SECONDS"""
+        if self._server is not None and time.monotonic() - self._last_used > SMTP_IDLE_SECONDS:
+            self.close()
+
+    def close(self):
+        if self._server is not None:
+            try:
+                self._server.quit()
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._server = None
+
+
+# Function to compute the retry delay after a failed attempt
+def backoff_seconds(attempts):
+    """Return the delay before retry number `attempts`, with jitter"""
+    delay = min(BACKOFF_BASE_SECONDS * 2 ** (attempts - 1), BACKOFF_MAX_SECONDS)
+    return delay * random.uniform(0.8, 1.2)
+
+
+class NotificationWorker(threading.Thread):
+    """Daemon thread that drains the email outbox"""
+
+    def __init__(self, store=message_store, digest_window=DIGEST_WINDOW_SECONDS, digest_max=DIGEST_MAX_MESSAGES):
+        super().__init__(name="notification-worker", daemon=True)
+        self.store = store
+        self.digest_window = digest_window
+        self.digest_max = digest_max
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._connection = None
+        self._digest_due_at = None
+        self._stats_lock = threading.Lock()
+        self.sent = 0
+        self.failed = 0
+        self.emails = 0
+        self._earlier_connections = 0
+        # Recent batch sizes and submit-to-delivery times, for stats()
+        self._batch_sizes = deque(maxlen=1000)
+        self._delivery_seconds = deque(maxlen=1000)
+
+    def wake(self):
+        """Ask the worker to check the outbox now instead of at its next poll"""
+        self._wake.set()
+
+    def stop(self):
+        self._stopping.set()
+        self._wake.set()
+
+    def run(self):
+        while not self._stopping.is_set():
+            try:
+                self.drain()
+            except Exception:
+                logger.exception("Notification worker failed to drain the outbox")
+            self._wait()
+        if self._connection is not None:
+            self._connection.close()
+
+    def _wait(self):
+        """Sleep until woken, until the next retry is due, or for POLL_SECONDS"""
+        timeout = POLL_SECONDS
+        due = self._digest_due_at or self.store.next_notification_due()
+        if due is not None:
+            timeout = max(0.0, min(timeout, due - time.time()))
+        self._wake.wait(timeout)
+        self._wake.clear()
+        if self._connection is not None:
+            self._connection.close_if_idle()
+
+    def drain(self):
+        """Send every due notification; returns the number of messages delivered"""
+        settings = smtp_settings()
+        if self._connection is None or self._connection.settings != settings:
+            if self._connection is not None:
+                self._connection.close()
+                self._earlier_connections += self._connection.opened
+            self._connection = SMTPConnection(settings)
+
+        if self.digest_window > 0:
+            return self._drain_digests(settings)
+
+        delivered = 0
+        while True:
+            entries = self.store.claim_notifications()
+            if not entries:
+                return delivered
+            for entry in entries:
+                if self._send([entry], build_email(entry, settings)):
+                    delivered += 1
+
+    def _drain_digests(self, settings):
+        """Send digests for every full batch and every window that has elapsed"""
+        delivered = 0
+        self._digest_due_at = None
+        while True:
+            count, oldest = self.store.due_notification_summary()
+            if count == 0:
+                return delivered
+            window_ends = oldest + self.digest_window
+            if count < self.digest_max and time.time() < window_ends:
+                # Keep collecting until the window closes or the batch fills up
+                self._digest_due_at = window_ends
+                return delivered
+            entries = self.store.claim_notifications(limit=self.digest_max)
+            if not entries:
+                return delivered
+            if len(entries) == 1:
+                email_message = build_email(entries[0], settings)
+            else:
+                email_message = build_digest_email(entries, settings)
+            if self._send(entries, email_message):
+                delivered += len(entries)
+
+    def _send(self, entries, email_message):
+        """Send one email covering `entries` and record the outcome"""
+        try:
+            self._connection.send(email_message)
+        except Exception as e:
+            self._connection.close()
+            for entry in entries:
+                self._record_failure(entry, e)
+            return False
+        self.store.mark_notifications_sent([entry["id"] for entry in entries])
+        now = time.time()
+        with self._stats_lock:
+            self.emails += 1
+            self.sent += len(entries)
+            self._batch_sizes.append(len(entries))
+            self._delivery_seconds.extend(now - entry["created_at"] for entry in entries)
+        return True
+
+    def stats(self):
+        """Return delivery counters, batch sizes and submit-to-delivery times"""
+        with self._stats_lock:
+            batch_sizes = list(self._batch_sizes)
+            delivery = sorted(self._delivery_seconds)
+            stats = {
+                "digest_window_seconds": self.digest_window,
+                "messages_sent": self.sent,
+                "emails_sent": self.emails,
+                "smtp_connections": self._earlier_connections + (self._connection.opened if self._connection else 0),
+                "failures": self.failed,
+                "mean_messages_per_email": statistics.fmean(batch_sizes) if batch_sizes else 0.0,
+                "max_messages_per_email": max(batch_sizes, default=0),
+            }
+        if delivery:
+            stats["delivery_seconds_p50"] = delivery[len(delivery) // 2]
+            stats["delivery_seconds_p95"] = delivery[min(len(delivery) - 1, int(len(delivery) * 0.95))]
+            stats["delivery_seconds_max"] = delivery[-1]
+        return stats
+
+    def _record_failure(self, entry, error):
+        with self._stats_lock:
+            self.failed += 1
+        attempts = entry["attempts"] + 1
+        if attempts >= MAX_ATTEMPTS:
+            logger.error("Giving up on notification %s after %s attempts: %s", entry["id"], attempts, error)
+            self.store.mark_notification_failed(entry["id"], str(error))
+        else:
+            logger.warning("Notification %s failed (attempt %s): %s", entry["id"], attempts, error)
+            self.store.mark_notification_failed(entry["id"], str(error), time.time() + backoff_seconds(attempts))
+
+
+_worker = None
+_worker_lock = threading.Lock()
+
+
+# Function to start the worker once per process
+def start_worker():
+    """Start the background notification worker if it is not already running"""
+    global _worker
+    with _worker_lock:
+        if _worker is None or not _worker.is_alive():
+            _worker = NotificationWorker()
+            _worker.start()
+        return _worker
+
+
+# Function to report worker statistics
+def worker_stats():
+    """Return the running worker's statistics, or None if it has not been started"""
+    with _worker_lock:
+        worker = _worker
+    return worker.stats() if worker is not None else None
@@ -0,0 +1,185 @@
+"""Rate limiting and duplicate detection for contact form submissions.
+
+A submission is checked before anything is stored or emailed:
+  1. an identical (name, email, message) seen within CONTACT_DEDUP_SECONDS
+     is dropped as a duplicate
+  2. a sliding one-hour window caps submissions from all clients together
+     (CONTACT_GLOBAL_HOURLY_LIMIT), protecting the disk and the mail relay
+  3. per client, a sliding one-hour window (CONTACT_HOURLY_LIMIT) caps the
+     sustained rate and a token bucket (CONTACT_BURST, refilled one token per
+     CONTACT_REFILL_SECONDS) caps bursts
+
+A submission that passes is remembered for duplicate detection straight
+away, so a double click cannot store it twice. If storing it then fails, the
+caller calls forget() so that the visitor's retry is not taken for a duplicate.
+
+State is in memory and shared by every session of the process.
+"""
+import hashlib
+import os
+import threading
+import time
+from collections import deque
+from typing import NamedTuple
+
+BURST = int(os.getenv("CONTACT_BURST", "3"))
+REFILL_SECONDS = float(os.getenv("CONTACT_REFILL_SECONDS", "60"))
+HOURLY_LIMIT = int(os.getenv("CONTACT_HOURLY_LIMIT", "10"))
+GLOBAL_HOURLY_LIMIT = int(os.getenv("CONTACT_GLOBAL_HOURLY_LIMIT", "200"))
+DEDUP_SECONDS = float(os.getenv("CONTACT_DEDUP_SECONDS", "86400"))
+WINDOW_SECONDS = 3600
+
+# Only trust X-Forwarded-For when a proxy in front of the app sets it
+TRUST_PROXY = os.getenv("PORTFOLIO_TRUST_PROXY", "0") == "1"
+
+# Idle clients are forgotten once this many checks have passed since the last sweep
+PRUNE_EVERY = 1000
+
+
+class Decision(NamedTuple):
+    """Outcome of a check: reason is "rate_limited" or "duplicate" when not allowed"""
+    allowed: bool
+    reason: str = ""
+    retry_after: float = 0.0
+
+
+# Function to fingerprint a submission
+def submission_digest(name, email, message):
+    """Return a hash identifying a submission regardless of case and surrounding whitespace"""
+    normalized = "\0".join((name.strip().lower(), email.strip().lower(), " ".join(message.split())))
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+# Function to pick the address a request should be limited by
+def client_address(remote_addr, forwarded_for=None):
+    """Return the client IP, taken from X-Forwarded-For only when PORTFOLIO_TRUST_PROXY=1"""
+    if TRUST_PROXY and forwarded_for:
+        return forwarded_for.split(",")[0].strip()
+    return remote_addr
+
+
+class SlidingWindow:
+    """Event timestamps per key over the last `window` seconds, capped at `limit`"""
+
+    def __init__(self, limit, window=WINDOW_SECONDS):
+        self.limit = limit
+        self.window = window
+        self._events = {}
+
+    def retry_after(self, key, now):
+        """Return 0 if another event is allowed now, else the seconds until one is"""
+        events = self._events.get(key)
+        if not events:
+            return 0.0
+        while events and events[0] <= now - self.window:
+            events.popleft()
+        if len(events) < self.limit:
+            return 0.0
+        return events[0] + self.window - now
+
+    def record(self, key, now):
+        self._events.setdefault(key, deque()).append(now)
+
+    def __len__(self):
+        return len(self._events)
+
+    def prune(self, now):
+        for key in [k for k, events in self._events.items() if not events or events[-1] <= now - self.window]:
+            del self._events[key]
+
+
+class TokenBucket:
+    """Per-key token buckets holding up to `capacity` tokens, refilled one per `refill_seconds`"""
+
+    def __init__(self, capacity, refill_seconds):
+        self.capacity = capacity
+        self.refill_seconds = refill_seconds
+        self._buckets = {}
+
+    def _tokens(self, key, now):
+        tokens, updated = self._buckets.get(key, (self.capacity, now))
+        return min(self.capacity, tokens + (now - updated) / self.refill_seconds)
+
+    def take(self, key, now):
+        """Take a token; return 0 on success, else the seconds until one is available"""
+        tokens = self._tokens(key, now)
+        if tokens < 1:
+            return (1 - tokens) * self.refill_seconds
+        self._buckets[key] = (tokens - 1, now)
+        return 0.0
+
+    def prune(self, now):
+        for key in [k for k in self._buckets if self._tokens(k, now) >= self.capacity]:
+            del self._buckets[key]
+
+
+class ContactGuard:
+    """Decides whether a contact submission may be stored and emailed"""
+
+    def __init__(self, burst=BURST, refill_seconds=REFILL_SECONDS, hourly_limit=HOURLY_LIMIT,
+                 global_hourly_limit=GLOBAL_HOURLY_LIMIT, dedup_seconds=DEDUP_SECONDS):
+        self.dedup_seconds = dedup_seconds
+        self._bucket = TokenBucket(burst, refill_seconds)
+        self._client_window = SlidingWindow(hourly_limit)
+        self._global_window = SlidingWindow(global_hourly_limit)
+        self._seen = {}
+        self._lock = threading.Lock()
+        self._checks = 0
+        self.accepted = 0
+        self.rate_limited = 0
+        self.duplicates = 0
+
+    def check(self, client, name, email, message, now=None):
+        """Return a Decision for a submission from `client`, recording it if allowed"""
+        now = time.time() if now is None else now
+        digest = submission_digest(name, email, message)
+        with self._lock:
+            self._checks += 1
+            if self._checks % PRUNE_EVERY == 0:
+                self._prune(now)
+
+            seen_at = self._seen.get(digest)
+            if seen_at is not None and now - seen_at < self.dedup_seconds:
+                self.duplicates += 1
+                return Decision(False, "duplicate")
+
+            # Windows are only inspected here; nothing is consumed until every limit agrees
+            wait = max(self._global_window.retry_after(None, now), self._client_window.retry_after(client, now))
+            if not wait:
+                wait = self._bucket.take(client, now)
+            if wait:
+                self.rate_limited += 1
+                return Decision(False, "rate_limited", wait)
+
+            self._global_window.record(None, now)
+            self._client_window.record(client, now)
+            self._seen[digest] = now
+            self.accepted += 1
+            return Decision(True)
+
+    def forget(self, name, email, message):
+        """Undo the duplicate record of an allowed submission that could not be stored"""
+        digest = submission_digest(name, email, message)
+        with self._lock:
+            if self._seen.pop(digest, None) is not None:
+                self.accepted -= 1
+
+    def _prune(self, now):
+        """Forget idle clients and expired duplicates so memory stays bounded"""
+        self._bucket.prune(now)
+        self._client_window.prune(now)
+        self._seen = {digest: seen_at for digest, seen_at in self._seen.items()
+                      if now - seen_at < self.dedup_seconds}
+
+    def stats(self):
+        """Return how many submissions were accepted, rate limited or dropped as duplicates"""
+        with self._lock:
+            return {
+                "accepted": self.accepted,
+                "rate_limited": self.rate_limited,
+                "duplicates": self.duplicates,
+                "tracked_clients": len(self._client_window),
+            }
+
+
+contact_guard = ContactGuard()
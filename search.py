@@ -0,0 +1,142 @@
+"""Search over the portfolio content with a prebuilt inverted index.
+
+The index is built once per content version (at warm-up, or on first use)
+and shared by every session; a query only looks terms up in it. Every query
+word is matched as a prefix of the indexed words through binary search over
+the sorted vocabulary, all words must match, and results are ranked by where
+they matched: titles weigh more than tech stacks, skills and courses, which
+weigh more than descriptions. Each result links to its card's anchor.
+"""
+import re
+import threading
+from bisect import bisect_left
+from typing import NamedTuple
+
+from fragments import anchor
+
+# How much a word counts depending on the field it appears in
+TITLE_WEIGHT = 3.0
+TAG_WEIGHT = 2.0
+TEXT_WEIGHT = 1.0
+# A word that only starts with the query term counts for less than an exact match
+PREFIX_FACTOR = 0.5
+MAX_RESULTS = 10
+
+
+class Document(NamedTuple):
+    """One searchable card: its section, title, a short summary and the id to jump to"""
+    kind: str
+    title: str
+    summary: str
+    anchor: str
+
+
+# Function to split text into index terms
+def tokenize(text):
+    """Return the lower-cased words of text, keeping trailing + and # (C++, C#)"""
+    return re.findall(r"[a-z0-9]+[+#]*", text.lower())
+
+
+# Function to list the searchable cards and their weighted fields
+def _documents(content):
+    """Yield (Document, [(weight, text)]) for every card that can be searched"""
+    for project in content.projects:
+        yield Document("Project", project.title, f"{project.org} · {project.date}", anchor("project", project.title)), [
+            (TITLE_WEIGHT, project.title),
+            *((TAG_WEIGHT, tech) for tech in project.tech_stack),
+            (TEXT_WEIGHT, f"{project.org} {project.type} {project.description}"),
+            *((TEXT_WEIGHT, feature) for feature in project.features),
+        ]
+    for exp in content.experience:
+        yield Document("Experience", exp.role, exp.organization, anchor("experience", exp.role)), [
+            (TITLE_WEIGHT, exp.role),
+            (TAG_WEIGHT, exp.organization),
+            *((TEXT_WEIGHT, point) for point in exp.points),
+        ]
+    for category in content.skill_categories:
+        yield Document("Skills", category.name, ", ".join(category.skills[:4]), anchor("skills", category.name)), [
+            (TITLE_WEIGHT, category.name),
+            *((TAG_WEIGHT, skill) for skill in category.skills),
+        ]
+    for acc in content.accomplishments:
+        yield Document("Accomplishment", acc.title, acc.detail, anchor("accomplishment", acc.title)), [
+            (TITLE_WEIGHT, acc.title),
+            (TEXT_WEIGHT, acc.detail),
+        ]
+    for edu in content.education:
+        yield Document("Education", edu.degree, edu.institution, anchor("education", edu.degree)), [
+            (TITLE_WEIGHT, edu.degree),
+            (TAG_WEIGHT, " ".join(edu.courses)),
+            (TEXT_WEIGHT, f"{edu.institution} {edu.location}"),
+        ]
+    for cert in content.certifications:
+        yield Document("Certification", cert.title, f"{cert.issuer} · {cert.date}", anchor("certification", cert.title)), [
+            (TITLE_WEIGHT, cert.title),
+            (TEXT_WEIGHT, cert.issuer),
+        ]
+
+
+class SearchIndex:
+    """Inverted index from term to (document number, weight) over one content version"""
+
+    def __init__(self, content):
+        self.version = content.version
+        documents, postings = [], {}
+        for number, (document, fields) in enumerate(_documents(content)):
+            documents.append(document)
+            weights = {}
+            for weight, text in fields:
+                for term in tokenize(text):
+                    # A term counts once per card, at the weight of its best field
+                    weights[term] = max(weights.get(term, 0.0), weight)
+            for term, weight in weights.items():
+                postings.setdefault(term, []).append((number, weight))
+        self.documents = tuple(documents)
+        self.postings = {term: tuple(entries) for term, entries in postings.items()}
+        self.vocabulary = tuple(sorted(postings))
+
+    def _term_scores(self, term):
+        """Return {document number: score} for every indexed word starting with term"""
+        scores = {}
+        for i in range(bisect_left(self.vocabulary, term), len(self.vocabulary)):
+            word = self.vocabulary[i]
+            if not word.startswith(term):
+                break
+            factor = 1.0 if word == term else PREFIX_FACTOR
+            for number, weight in self.postings[word]:
+                scores[number] = max(scores.get(number, 0.0), weight * factor)
+        return scores
+
+    def search(self, query, limit=MAX_RESULTS):
+        """Return the Documents matching every word of query, best first"""
+        scores = None
+        for term in dict.fromkeys(tokenize(query)):
+            term_scores = self._term_scores(term)
+            if scores is None:
+                scores = term_scores
+            else:
+                scores = {number: score + term_scores[number] for number, score in scores.items()
+                          if number in term_scores}
+            if not scores:
+                return []
+        if scores is None:
+            return []
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        return [self.documents[number] for number, _ in ranked[:limit]]
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+# Function to get the index for the current content
+def index_for(content):
+    """Return the shared SearchIndex for content, building it only when the version changes"""
+    global _index
+    index = _index
+    if index is not None and index.version == content.version:
+        return index
+    with _index_lock:
+        if _index is None or _index.version != content.version:
+            _index = SearchIndex(content)
+        return _index
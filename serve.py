@@ -0,0 +1,28 @@
+"""Start the portfolio with its caches warmed before the first visitor arrives.
+
+    python serve.py                       # same as `streamlit run app.py`
+    python serve.py --server.port 8080    # extra arguments go to `streamlit run`
+
+Streamlit only runs app.py once a browser session connects, so with a plain
+`streamlit run app.py` the first visitor of a fresh replica waits for the
+warm-up. This launcher starts it in the server process first.
+"""
+import sys
+from pathlib import Path
+
+import warmup
+
+APP_PATH = Path(__file__).parent / "app.py"
+
+
+def main(argv=None):
+    from streamlit.web import cli as stcli
+
+    warmup.start()
+    args = sys.argv[1:] if argv is None else argv
+    sys.argv = ["streamlit", "run", str(APP_PATH), *args]
+    return stcli.main()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
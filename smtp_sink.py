@@ -0,0 +1,117 @@
+"""Local stand-in SMTP server that accepts and records every email.
+
+Useful for exercising the notification worker without a real mail provider:
+
+    python smtp_sink.py --port 1025
+    SMTP_SERVER=localhost SMTP_PORT=1025 SMTP_STARTTLS=0 SENDER_EMAIL=me@example.com streamlit run app.py
+
+It can also be started in-process with SMTPSink().start().
+"""
+import argparse
+import socketserver
+import threading
+import time
+
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+    """Speaks just enough SMTP for smtplib: EHLO/HELO, MAIL, RCPT, DATA, RSET, NOOP, QUIT"""
+
+    def _reply(self, line):
+        self.wfile.write(line.encode("ascii") + b"\r\n")
+
+    def handle(self):
+        sink = self.server.sink
+        sink.connections += 1
+        self._reply("220 smtp-sink ready")
+        sender, recipients = None, []
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode("utf-8", "replace").strip()
+            verb = command[:4].upper()
+            if verb == "EHLO":
+                self._reply("250-smtp-sink")
+                self._reply("250 8BITMIME")
+            elif verb == "HELO":
+                self._reply("250 smtp-sink")
+            elif verb == "MAIL":
+                sender, recipients = command[10:].strip(), []
+                self._reply("250 OK")
+            elif verb == "RCPT":
+                recipients.append(command[8:].strip())
+                self._reply("250 OK")
+            elif verb == "DATA":
+                self._reply("354 End data with <CR><LF>.<CR><LF>")
+                body = []
+                for data_line in self.rfile:
+                    if data_line in (b".\r\n", b".\n"):
+                        break
+                    body.append(data_line[1:] if data_line.startswith(b"..") else data_line)
+                sink.record(sender, recipients, b"".join(body))
+                self._reply("250 OK")
+            elif verb in ("RSET", "NOOP"):
+                self._reply("250 OK")
+            elif verb == "QUIT":
+                self._reply("221 Bye")
+                return
+            else:
+                self._reply("502 Command not implemented")
+
+
+class _Server(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class SMTPSink:
+    """Threaded SMTP sink that keeps received messages in memory"""
+
+    def __init__(self, host="127.0.0.1", port=1025, verbose=False):
+        self.host = host
+        self.port = port
+        self.verbose = verbose
+        self.messages = []
+        self.connections = 0
+        self._lock = threading.Lock()
+        self._server = None
+
+    def record(self, sender, recipients, data):
+        with self._lock:
+            self.messages.append({"sender": sender, "recipients": recipients, "data": data, "received_at": time.time()})
+        if self.verbose:
+            print(f"received {len(data)} bytes from {sender} for {', '.join(recipients)}")
+
+    def start(self):
+        """Start serving in a background thread and return self"""
+        self._server = _Server((self.host, self.port), _SMTPHandler)
+        self._server.sink = self
+        # Port 0 picks a free port; report the real one
+        self.port = self._server.server_address[1]
+        threading.Thread(target=self._server.serve_forever, name="smtp-sink", daemon=True).start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run a local SMTP sink")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=1025)
+    args = parser.parse_args(argv)
+
+    sink = SMTPSink(args.host, args.port, verbose=True).start()
+    print(f"SMTP sink listening on {sink.host}:{sink.port} (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        sink.stop()
+
+
+if __name__ == "__main__":
+    main()
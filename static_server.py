@@ -0,0 +1,286 @@
+"""Serve the exported static site together with its contact endpoint.
+
+    python export_site.py
+    python static_server.py --root dist --port 8000
+    python static_server.py --assets --port 8001    # static/ and images/ for app.py
+
+In production dist/ can sit behind any static file server or CDN. Only POST
+/api/contact needs to reach this process, which stores the message and queues
+its email notification exactly like the Streamlit app does.
+
+With --assets, static/ and images/ are also served under /static/ and
+/images/, which is what PORTFOLIO_ASSET_BASE_URL points app.py at. Files whose
+name carries the hash of their content (<stem>.<hash><suffix>, as written by
+export_site.py and assets.fingerprinted_path) are sent with a year-long
+immutable Cache-Control; everything else must be revalidated. Every response
+carries a strong ETag and conditional GETs are answered with 304.
+
+When compress_assets.py has written .br/.gz siblings, the smallest encoding
+the client's Accept-Encoding allows is sent as is, with no compression work
+per request.
+"""
+import argparse
+import html
+import json
+import logging
+import mimetypes
+import sys
+from pathlib import Path
+from socketserver import ThreadingMixIn
+from urllib.parse import parse_qs
+from wsgiref.simple_server import WSGIServer, make_server
+from wsgiref.util import FileWrapper
+
+import notifications
+from assets import IMAGES_DIR, STATIC_DIR, file_digests, split_fingerprint
+from compress_assets import ENCODINGS, precompressed_sibling
+from message_store import message_store, validate_message
+from rate_limit import client_address, contact_guard
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ROOT = Path(__file__).parent / "dist"
+ASSET_MOUNTS = {"/static/": STATIC_DIR, "/images/": IMAGES_DIR}
+MAX_BODY_BYTES = 64 * 1024
+
+# Shown after a contact form post made without JavaScript
+CONTACT_STATUS_PAGE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{title}</title>
+</head>
+<body style="font-family: sans-serif; max-width: 40rem; margin: 4rem auto; padding: 0 1.5rem;">
+<h1>{title}</h1>
+{details}
+<p><a href="/#contact">Back to the portfolio</a></p>
+</body>
+</html>
+"""
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+
+class PortfolioApp:
+    """WSGI application serving files from root (and optional mounts) plus POST /api/contact"""
+
+    def __init__(self, root=DEFAULT_ROOT, mounts=None):
+        self.root = Path(root).resolve()
+        self.mounts = {prefix: Path(directory).resolve() for prefix, directory in (mounts or {}).items()}
+
+    def __call__(self, environ, start_response):
+        method = environ["REQUEST_METHOD"]
+        path = environ.get("PATH_INFO") or "/"
+        if path == "/api/contact":
+            if method != "POST":
+                return self._respond(start_response, "405 Method Not Allowed", b"", [("Allow", "POST")])
+            return self.handle_contact(environ, start_response)
+        if method not in ("GET", "HEAD"):
+            return self._respond(start_response, "405 Method Not Allowed", b"", [("Allow", "GET, HEAD")])
+        return self.serve_file(environ, start_response, path)
+
+    def _respond(self, start_response, status, body, headers=()):
+        start_response(status, [("Content-Length", str(len(body))), *headers])
+        return [body]
+
+    def _contact_result(self, start_response, wants_json, status, errors, headers=()):
+        """Answer a contact post with JSON for the page's script, or a status page for plain form posts"""
+        if wants_json:
+            payload = json.dumps({"ok": not errors, "errors": errors})
+            return self._respond(start_response, status, payload.encode("utf-8"),
+                                 [("Content-Type", "application/json"), *headers])
+        if errors:
+            title = "Your message was not sent"
+            details = "<ul>" + "".join(f"<li>{html.escape(error)}</li>" for error in errors.values()) + "</ul>"
+        else:
+            title = "Thank you for your message!"
+            details = "<p>I will get back to you soon.</p>"
+        page = CONTACT_STATUS_PAGE.format(title=title, details=details)
+        return self._respond(start_response, status, page.encode("utf-8"),
+                             [("Content-Type", "text/html; charset=utf-8"), *headers])
+
+    def _safe_join(self, base, relative):
+        """Return base/relative if it is an existing file inside base, else None"""
+        candidate = (base / relative).resolve()
+        if candidate.is_dir():
+            candidate = candidate / "index.html"
+        if not candidate.is_relative_to(base) or not candidate.is_file():
+            return None
+        return candidate
+
+    def _resolve(self, path):
+        """Map a URL path to (file, fingerprint in the URL), refusing anything outside the served folders
+
+        A fingerprinted URL whose file does not exist under that name is mapped
+        to the un-fingerprinted file, so assets can be linked by content hash
+        without writing hashed copies to disk.
+        """
+        base, relative = self.root, path.lstrip("/") or "index.html"
+        for prefix, directory in self.mounts.items():
+            if path.startswith(prefix):
+                base, relative = directory, path[len(prefix):]
+                break
+        fingerprint = split_fingerprint(Path(relative).name)[1]
+        file_path = self._safe_join(base, relative)
+        if file_path is None and fingerprint is not None:
+            original = split_fingerprint(Path(relative).name)[0]
+            file_path = self._safe_join(base, str(Path(relative).with_name(original)))
+        return file_path, fingerprint
+
+    def serve_file(self, environ, start_response, path):
+        file_path, fingerprint = self._resolve(path)
+        if file_path is None:
+            return self._respond(start_response, "404 Not Found", b"Not Found", [("Content-Type", "text/plain")])
+        digest = file_digests.get(file_path)
+        etag = f'"{digest[:32]}"'
+        # Only a URL naming the current content may be cached forever
+        if fingerprint is not None and digest.startswith(fingerprint):
+            cache_control = IMMUTABLE_CACHE_CONTROL
+        else:
+            cache_control = REVALIDATE_CACHE_CONTROL
+        headers = [("Cache-Control", cache_control)]
+
+        body_path = file_path
+        siblings = {encoding: precompressed_sibling(file_path, encoding) for encoding, _ in ENCODINGS}
+        if any(siblings.values()):
+            headers.append(("Vary", "Accept-Encoding"))
+            accepted = accepted_encodings(environ.get("HTTP_ACCEPT_ENCODING"), [encoding for encoding, _ in ENCODINGS])
+            for encoding, _ in ENCODINGS:
+                if siblings[encoding] is not None and encoding in accepted:
+                    body_path = siblings[encoding]
+                    # Each encoding is its own representation and needs its own validator
+                    etag = f'"{digest[:32]}-{encoding}"'
+                    headers.append(("Content-Encoding", encoding))
+                    break
+        headers.append(("ETag", etag))
+
+        if etag_matches(environ.get("HTTP_IF_NONE_MATCH"), etag):
+            start_response("304 Not Modified", headers)
+            return [b""]
+
+        content_type = mimetypes.guess_type(file_path.name)[0] or "application/octet-stream"
+        if content_type.startswith("text/") or content_type in ("application/javascript", "image/svg+xml"):
+            content_type += "; charset=utf-8"
+        headers += [("Content-Type", content_type), ("Content-Length", str(body_path.stat().st_size))]
+        start_response("200 OK", headers)
+        if environ["REQUEST_METHOD"] == "HEAD":
+            return [b""]
+        return FileWrapper(open(body_path, "rb"))
+
+    def handle_contact(self, environ, start_response):
+        """Validate and store a contact form submission"""
+        try:
+            length = int(environ.get("CONTENT_LENGTH") or 0)
+        except ValueError:
+            length = 0
+        if length > MAX_BODY_BYTES:
+            return self._respond(start_response, "413 Payload Too Large", b"")
+        body = environ["wsgi.input"].read(length)
+
+        if environ.get("CONTENT_TYPE", "").startswith("application/json"):
+            try:
+                fields = json.loads(body or b"{}")
+            except ValueError:
+                # Malformed JSON, or bytes that are not UTF-8
+                fields = None
+            if not isinstance(fields, dict):
+                return self._contact_result(start_response, True, "400 Bad Request",
+                                            {"form": "The request body must be a JSON object."})
+        else:
+            fields = {k: v[0] for k, v in parse_qs(body.decode("utf-8", "replace")).items()}
+        # A value that is not a string (null, a number, a list) counts as missing
+        name, email, message = (value if isinstance(value, str) else ""
+                                for value in (fields.get("name"), fields.get("email"), fields.get("message")))
+
+        errors = validate_message(name, email, message)
+        wants_json = "application/json" in environ.get("HTTP_ACCEPT", "")
+        if not errors:
+            # Floods are turned away and repeats acknowledged without being stored again
+            client = client_address(environ.get("REMOTE_ADDR"), environ.get("HTTP_X_FORWARDED_FOR"))
+            decision = contact_guard.check(f"ip:{client}", name, email, message)
+            if decision.reason == "rate_limited":
+                retry_after = [("Retry-After", str(max(1, round(decision.retry_after))))]
+                return self._contact_result(start_response, wants_json, "429 Too Many Requests",
+                                            {"form": "Too many messages sent. Please try again later."}, retry_after)
+            if decision.allowed:
+                try:
+                    message_store.add(name, email, message, notify=notifications.is_configured())
+                except Exception:
+                    logger.exception("Could not store contact message")
+                    # Not stored, so a retry must not be answered as a duplicate
+                    contact_guard.forget(name, email, message)
+                    return self._contact_result(start_response, wants_json, "500 Internal Server Error",
+                                                {"form": "Your message could not be saved. Please try again."})
+                if notifications.is_configured():
+                    notifications.start_worker().wake()
+
+        return self._contact_result(start_response, wants_json, "400 Bad Request" if errors else "200 OK", errors)
+
+
+# Function to parse an Accept-Encoding header
+def accepted_encodings(accept_encoding, available):
+    """Return the codings in available that the client accepts (q > 0)
+
+    A coding listed with q=0 is refused even when the header also has "*".
+    """
+    accepted, refused, wildcard = set(), set(), False
+    for part in (accept_encoding or "").split(","):
+        coding, *params = [piece.strip() for piece in part.split(";")]
+        coding = coding.lower()
+        quality = 1.0
+        for param in params:
+            if param.startswith("q="):
+                try:
+                    quality = float(param[2:])
+                except ValueError:
+                    quality = 0.0
+        if not coding:
+            continue
+        if coding == "*":
+            wildcard = quality > 0
+        elif quality > 0:
+            accepted.add(coding)
+        else:
+            refused.add(coding)
+    return {coding for coding in available
+            if coding in accepted or wildcard and coding not in refused}
+
+
+# Function to evaluate an If-None-Match header
+def etag_matches(if_none_match, etag):
+    """Return True if the If-None-Match header lists etag (or *)"""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+class ThreadingWSGIServer(ThreadingMixIn, WSGIServer):
+    daemon_threads = True
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the exported static portfolio")
+    parser.add_argument("--root", default=str(DEFAULT_ROOT))
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--assets", action="store_true", help="also serve static/ and images/ for app.py")
+    args = parser.parse_args(argv)
+
+    app = PortfolioApp(args.root, ASSET_MOUNTS if args.assets else None)
+    server = make_server(args.host, args.port, app, server_class=ThreadingWSGIServer)
+    print(f"Serving {args.root} on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
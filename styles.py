@@ -0,0 +1,192 @@
+"""Stylesheets for the portfolio: style.css, the base rules in base.css and per-theme overrides.
+
+The sources are compiled once per process (and again only when a source file
+changes) into minified, content-hashed stylesheets. Each compiled stylesheet
+is also written to static/css/, with precompressed siblings, so it can be
+served as a long-lived cacheable file instead of being re-sent inline.
+"""
+import hashlib
+import os
+import re
+import threading
+from pathlib import Path
+from typing import NamedTuple
+
+from compress_assets import compress_file
+
+ROOT_DIR = Path(__file__).parent
+STYLE_CSS_PATH = ROOT_DIR / "style.css"
+BASE_CSS_PATH = ROOT_DIR / "base.css"
+COMPILED_CSS_DIR = ROOT_DIR / "static" / "css"
+
+THEME_COLORS = {
+    "Blue": {"bg": "#0a192f", "text": "#e6f1ff", "accent": "#64ffda"},
+    "Green": {"bg": "#0f1a0f", "text": "#e6ffe6", "accent": "#4dff4d"}
+}
+
+DEFAULT_THEME = "Blue"
+
+# Set to 1 to inline the compiled CSS instead of linking static/css/ (for Streamlit
+# before 1.57, whose static file serving sends .css files as text/plain)
+INLINE_CSS = os.getenv("PORTFOLIO_INLINE_CSS", "0") == "1"
+
+
+# Function to read the base stylesheet
+def base_css():
+    """Return the base CSS rules shared by every theme"""
+    return BASE_CSS_PATH.read_text()
+
+
+# Function to build the CSS overrides for one theme
+def theme_css(theme):
+    """Return the CSS that applies a theme's colors"""
+    colors = THEME_COLORS[theme]
+    return f"""
+.stApp {{
+    background-color: {colors["bg"]};
+    color: {colors["text"]};
+}}
+.highlight, .section-header h2 {{
+    color: {colors["accent"]} !important;
+}}
+.custom-card {{
+    border-left: 4px solid {colors["accent"]};
+}}
+.skill-bar {{
+    background-color: {colors["accent"]};
+}}
+.timeline-dot {{
+    background-color: {colors["accent"]};
+}}
+.tech-badge {{
+    color: {colors["accent"]};
+}}
+.project-icon {{
+    color: {colors["accent"]};
+}}
+.contact-item i {{
+    color: {colors["accent"]};
+}}
+.social-links a {{
+    color: {colors["accent"]};
+}}
+.contact-button {{
+    background-color: {colors["accent"]};
+}}
+.contact-button:hover {{
+    background-color: {colors["accent"]};
+    opacity: 0.9;
+}}
+"""
+
+
+# Comments, which are dropped, and quoted strings, which are kept as written
+_COMMENTS_AND_STRINGS = re.compile(r"""(/\*.*?\*/)|("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')""", re.S)
+_WHITESPACE = re.compile(r"\s+")
+_AROUND_PUNCTUATION = re.compile(r"\s*([{};,>])\s*")
+# Only the space after a colon goes: before one it can be a descendant combinator (div :hover)
+_AFTER_COLON = re.compile(r":\s+")
+
+
+# Function to minify the CSS between quoted strings
+def _minify_code(css):
+    css = _WHITESPACE.sub(" ", css)
+    css = _AROUND_PUNCTUATION.sub(r"\1", css)
+    css = _AFTER_COLON.sub(":", css)
+    return css.replace(";}", "}")
+
+
+# Function to minify a stylesheet
+def minify_css(css):
+    """Strip comments and redundant whitespace from CSS, leaving quoted strings as they are"""
+    parts, code, position = [], "", 0
+    for match in _COMMENTS_AND_STRINGS.finditer(css):
+        code += css[position:match.start()]
+        position = match.end()
+        if match.group(2):
+            parts += [_minify_code(code), match.group(2)]
+            code = ""
+    parts.append(_minify_code(code + css[position:]))
+    return "".join(parts).strip()
+
+
+class Stylesheet(NamedTuple):
+    """A compiled stylesheet and the content-hashed file name it is published under"""
+    css: str
+    digest: str
+    file_name: str
+
+
+class StylesheetCompiler:
+    """Compiles and caches the shared and per-theme stylesheets"""
+
+    def __init__(self, output_dir=COMPILED_CSS_DIR):
+        self.output_dir = Path(output_dir)
+        self._lock = threading.Lock()
+        self._signature = None
+        self._compiled = {}
+
+    def _source_signature(self):
+        return tuple(
+            (os.stat(path).st_mtime_ns, os.stat(path).st_size) for path in (STYLE_CSS_PATH, BASE_CSS_PATH)
+        )
+
+    def _publish(self, name, css):
+        digest = hashlib.sha256(css.encode("utf-8")).hexdigest()[:12]
+        stylesheet = Stylesheet(css, digest, f"{name}.{digest}.css")
+        path = self.output_dir / stylesheet.file_name
+        if not path.exists():
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_text(css, encoding="utf-8")
+            os.replace(tmp_path, path)
+            compress_file(path)
+        return stylesheet
+
+    def get(self, name):
+        """Return the compiled stylesheet `name`: "common" or "portfolio-<theme>" / "theme-<theme>"
+
+        "common" is style.css plus base.css, "theme-<theme>" holds only the
+        theme overrides, and "portfolio-<theme>" merges all three.
+        """
+        signature = self._source_signature()
+        with self._lock:
+            if signature != self._signature:
+                self._compiled = {}
+                self._signature = signature
+            stylesheet = self._compiled.get(name)
+            if stylesheet is None:
+                stylesheet = self._publish(name, self._compile(name))
+                self._compiled[name] = stylesheet
+            return stylesheet
+
+    def _compile(self, name):
+        if name == "common":
+            return minify_css(STYLE_CSS_PATH.read_text() + "\n" + base_css())
+        kind, _, theme = name.partition("-")
+        if kind == "theme":
+            return minify_css(theme_css(theme))
+        if kind == "portfolio":
+            return minify_css(STYLE_CSS_PATH.read_text() + "\n" + base_css() + "\n" + theme_css(theme))
+        raise KeyError(name)
+
+
+stylesheet_compiler = StylesheetCompiler()
+
+
+# Function to get the rules shared by every theme
+def common_stylesheet():
+    """Return the compiled style.css + base.css stylesheet"""
+    return stylesheet_compiler.get("common")
+
+
+# Function to get the overrides for one theme
+def theme_stylesheet(theme):
+    """Return the compiled overrides for a theme"""
+    return stylesheet_compiler.get(f"theme-{theme}")
+
+
+# Function to get everything a theme needs in one file
+def portfolio_stylesheet(theme):
+    """Return the compiled, merged stylesheet for a theme"""
+    return stylesheet_compiler.get(f"portfolio-{theme}")
@@ -0,0 +1,29 @@
+"""Shared pytest setup: import the app's modules from the repository root and keep
+their data out of the working tree."""
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+# Must be set before message_store is imported, since it reads the data directory at import time
+os.environ.setdefault("PORTFOLIO_DATA_DIR", tempfile.mkdtemp(prefix="portfolio-tests-"))
+
+# Function to build a project entry as it appears in content.json
+def project_entry(title, tech_stack=(), org="C-DAC, Hyderabad", type="Main Project", description="", features=()):
+    return {"title": title, "date": "January 2025", "org": org, "type": type, "description": description,
+            "features": list(features), "tech_stack": list(tech_stack), "github": "", "image": ""}
+
+
+@pytest.fixture
+def make_content():
+    """Return a function building Content from a small content.json document"""
+    from content import parse_content
+
+    def make(projects=(), **sections):
+        raw = {"skill_categories": [], "soft_skills": [], "experience": [], "accomplishments": [],
+               "education": [], "certifications": [], "languages": [], **sections, "projects": list(projects)}
+        return parse_content(raw, "test")
+    return make
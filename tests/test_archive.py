@@ -0,0 +1,154 @@
+import gzip
+import json
+import time
+
+import pytest
+
+from archive import Compactor, iter_messages, segment_month, segments
+from message_store import MessageStore
+
+# Compaction cutoffs are computed in local time, so "now" is a local date too
+NOW = time.mktime((2026, 6, 15, 12, 0, 0, 0, 0, -1))
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = MessageStore(db_path=tmp_path / "messages.db", legacy_json_path=tmp_path / "missing.json")
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def archive_dir(tmp_path):
+    return tmp_path / "archive"
+
+
+def compactor(store, archive_dir, archive_after_days=30, retention_days=0, segment_max=100):
+    return Compactor(store=store, archive_dir=archive_dir, archive_after_days=archive_after_days,
+                     retention_days=retention_days, segment_max=segment_max)
+
+
+def add(store, *timestamps, notify=False):
+    return [store.add("Ada", "ada@example.com", f"Sent {timestamp}", timestamp=timestamp, notify=notify)
+            for timestamp in timestamps]
+
+
+def read_segment(path):
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def segment_names(archive_dir):
+    return [path.name for _, path in segments(archive_dir)]
+
+
+def test_segment_month():
+    assert segment_month("2026-03-10 08:00:00") == "2026-03"
+    assert segment_month("") == "0000-00"
+
+
+def test_whole_months_are_sealed(store, archive_dir):
+    add(store, "2026-03-10 08:00:00", "2026-03-20 08:00:00", "2026-04-05 08:00:00",
+        "2026-05-02 08:00:00", "2026-06-01 08:00:00")
+    result = compactor(store, archive_dir).compact(NOW)
+
+    # The cutoff is 2026-05-16, so May is still live: only whole months are sealed
+    assert (result["archived"], result["segments_written"]) == (3, 2)
+    assert segment_names(archive_dir) == ["messages-2026-03-001.jsonl.gz", "messages-2026-04-001.jsonl.gz"]
+    march = read_segment(archive_dir / "messages-2026-03-001.jsonl.gz")
+    assert [m["timestamp"] for m in march] == ["2026-03-10 08:00:00", "2026-03-20 08:00:00"]
+    assert march[0]["read"] is False
+    assert store.count() == 2
+    assert not list(archive_dir.glob("*.tmp"))
+
+    # A second run has nothing left to do
+    assert compactor(store, archive_dir).compact(NOW)["archived"] == 0
+
+
+def test_large_month_is_split_into_segments(store, archive_dir):
+    add(store, *(f"2026-03-0{day} 08:00:00" for day in range(1, 6)))
+    result = compactor(store, archive_dir, segment_max=2).compact(NOW)
+
+    assert (result["archived"], result["segments_written"]) == (5, 3)
+    assert segment_names(archive_dir) == [f"messages-2026-03-00{part}.jsonl.gz" for part in (1, 2, 3)]
+    assert [len(read_segment(path)) for _, path in segments(archive_dir)] == [2, 2, 1]
+
+
+def test_pending_notification_keeps_a_message_live(store, archive_dir):
+    (pending,) = add(store, "2026-03-10 08:00:00", notify=True)
+    add(store, "2026-03-11 08:00:00")
+    assert compactor(store, archive_dir).compact(NOW)["archived"] == 1
+    assert store.count() == 1
+
+    # Once delivered it goes into a further segment of the already sealed month
+    claimed = store.claim_notifications()
+    assert [entry["message_id"] for entry in claimed] == [pending]
+    store.mark_notifications_sent([entry["id"] for entry in claimed])
+    assert compactor(store, archive_dir).compact(NOW)["archived"] == 1
+    assert segment_names(archive_dir) == ["messages-2026-03-001.jsonl.gz", "messages-2026-03-002.jsonl.gz"]
+    assert store.count() == 0
+
+
+def test_recovery_keeps_sealed_and_drops_unsealed_tmp_files(store, archive_dir):
+    archive_dir.mkdir()
+    sealed = archive_dir / "messages-2026-01-001.jsonl.gz"
+    unsealed = archive_dir / "messages-2026-02-001.jsonl.gz"
+    for path in (sealed, unsealed):
+        with gzip.open(path.with_name(path.name + ".tmp"), "wt", encoding="utf-8") as f:
+            f.write(json.dumps({"id": 1, "timestamp": "2026-01-05 08:00:00"}) + "\n")
+    # Only the first one got as far as the transaction that records it
+    store.remove_messages([], sealed_segment=sealed.name)
+
+    compactor(store, archive_dir, archive_after_days=0).compact(NOW)
+
+    assert sealed.is_file()
+    assert not unsealed.exists()
+    assert not list(archive_dir.glob("*.tmp"))
+
+
+def test_retention_deletes_old_messages_and_segments(store, archive_dir):
+    add(store, "2026-01-10 08:00:00", "2026-02-10 08:00:00")
+    compactor(store, archive_dir).compact(NOW)
+    assert segment_names(archive_dir) == ["messages-2026-01-001.jsonl.gz", "messages-2026-02-001.jsonl.gz"]
+
+    add(store, "2026-03-01 08:00:00", "2026-03-20 08:00:00", "2026-06-10 08:00:00")
+    # The retention cutoff is 2026-03-07 12:00
+    result = compactor(store, archive_dir, retention_days=100).compact(NOW)
+
+    assert result["expired_messages"] == 1
+    assert result["expired_segments"] == 2
+    assert result["archived"] == 1
+    assert segment_names(archive_dir) == ["messages-2026-03-001.jsonl.gz"]
+    assert [m["timestamp"] for m in read_segment(archive_dir / "messages-2026-03-001.jsonl.gz")] == \
+        ["2026-03-20 08:00:00"]
+    assert store.count() == 1
+
+
+def test_retention_alone_deletes_without_archiving(store, archive_dir):
+    add(store, "2026-01-10 08:00:00", "2026-06-10 08:00:00")
+    result = compactor(store, archive_dir, archive_after_days=0, retention_days=100).compact(NOW)
+    assert (result["expired_messages"], result["archived"]) == (1, 0)
+    assert segments(archive_dir) == []
+    assert store.count() == 1
+
+
+def test_iter_messages_reads_archive_then_live(store, archive_dir):
+    timestamps = ["2026-03-10 08:00:00", "2026-04-05 08:00:00", "2026-04-20 08:00:00",
+                  "2026-05-02 08:00:00", "2026-06-01 08:00:00"]
+    ids = add(store, *timestamps)
+    compactor(store, archive_dir).compact(NOW)
+
+    messages = [m for chunk in iter_messages(chunk_size=2, store=store, archive_dir=archive_dir) for m in chunk]
+    assert [m["id"] for m in messages] == ids
+    assert [m["timestamp"] for m in messages] == timestamps
+
+    bounded = [m["timestamp"] for chunk in iter_messages("2026-04-10 00:00:00", "2026-05-31 23:59:59",
+                                                          store=store, archive_dir=archive_dir) for m in chunk]
+    assert bounded == ["2026-04-20 08:00:00", "2026-05-02 08:00:00"]
+
+
+def test_iter_messages_chunk_sizes(store, archive_dir):
+    add(store, *(f"2026-03-0{day} 08:00:00" for day in range(1, 6)))
+    compactor(store, archive_dir).compact(NOW)
+    chunks = list(iter_messages(chunk_size=2, store=store, archive_dir=archive_dir))
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
@@ -0,0 +1,83 @@
+import pytest
+
+from conftest import project_entry
+from content import bit_count, facet_counts, load_content, project_bitset, project_in, projects_in
+
+
+@pytest.fixture
+def content(make_content):
+    return make_content([
+        project_entry("Knowledge Graph", ["Python", "Streamlit"], org="C-DAC", type="Main Project"),
+        project_entry("Sales Dashboard", ["Power BI", "SQL"], org="Acme", type="Mini Project"),
+        project_entry("Chat Assistant", ["Python", "SQL"], org="C-DAC", type="Mini Project"),
+        project_entry("Portfolio", ["Python"], org="Personal", type="Personal Project"),
+    ])
+
+
+def titles(projects):
+    return [project.title for project in projects]
+
+
+def test_bit_count():
+    assert bit_count(0) == 0
+    assert bit_count(0b1011) == 3
+    assert bit_count(1 << 200) == 1
+
+
+def test_facet_values_are_ordered_by_project_count(content):
+    tech = content.project_facets["Tech stack"]
+    assert list(tech) == ["Python", "SQL", "Power BI", "Streamlit"]
+    assert tech["Python"] == 0b1101
+    assert content.project_facets["Organization"]["C-DAC"] == 0b0101
+
+
+def test_no_selection_matches_every_project(content):
+    assert project_bitset(content, {}) == 0b1111
+    assert project_bitset(content, {"Tech stack": [], "Type": []}) == 0b1111
+
+
+def test_values_within_a_facet_are_alternatives(content):
+    bits = project_bitset(content, {"Tech stack": ["Streamlit", "Power BI"]})
+    assert titles(projects_in(content, bits)) == ["Knowledge Graph", "Sales Dashboard"]
+
+
+def test_facets_are_combined(content):
+    bits = project_bitset(content, {"Tech stack": ["SQL"], "Organization": ["C-DAC"]})
+    assert titles(projects_in(content, bits)) == ["Chat Assistant"]
+    assert project_bitset(content, {"Tech stack": ["Power BI"], "Organization": ["Personal"]}) == 0
+
+
+def test_unknown_value_matches_nothing(content):
+    assert project_bitset(content, {"Tech stack": ["Rust"]}) == 0
+
+
+def test_skip_ignores_one_facet(content):
+    selections = {"Tech stack": ["SQL"], "Organization": ["C-DAC"]}
+    assert project_bitset(content, selections, skip="Organization") == 0b0110
+
+
+def test_facet_counts_use_the_other_facets_only(content):
+    counts = facet_counts(content, {"Tech stack": ["SQL"], "Type": ["Mini Project"]})
+    # Picking another tech stack widens the result, so its count ignores the current tech pick
+    assert counts["Tech stack"] == {"Python": 1, "SQL": 2, "Power BI": 1, "Streamlit": 0}
+    assert counts["Organization"] == {"C-DAC": 1, "Acme": 1, "Personal": 0}
+    assert counts["Type"] == {"Mini Project": 2, "Main Project": 0, "Personal Project": 0}
+
+
+def test_project_in(content):
+    bits = project_bitset(content, {"Organization": ["C-DAC"]})
+    assert project_in(content, "Knowledge Graph", bits)
+    assert project_in(content, "chat assistant", bits)
+    assert not project_in(content, "Sales Dashboard", bits)
+    assert not project_in(content, "No Such Project", bits)
+
+
+def test_shipped_content_parses_into_consistent_facets():
+    content = load_content()
+    everything = project_bitset(content, {})
+    assert bit_count(everything) == len(content.projects)
+    for bitsets in content.project_facets.values():
+        for value, bits in bitsets.items():
+            assert bits and bits & ~everything == 0
+    for project in content.projects:
+        assert project_in(content, project.title, everything)
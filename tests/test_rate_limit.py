@@ -0,0 +1,113 @@
+import pytest
+
+from rate_limit import ContactGuard, SlidingWindow, TokenBucket, submission_digest
+
+
+def guard(**limits):
+    options = dict(burst=3, refill_seconds=60, hourly_limit=10, global_hourly_limit=200, dedup_seconds=86400)
+    options.update(limits)
+    return ContactGuard(**options)
+
+
+def message(n):
+    return ("Ada", "ada@example.com", f"Message number {n}")
+
+
+def test_digest_ignores_case_and_whitespace():
+    assert submission_digest(" Ada ", "ADA@example.com", "hello   there\n") == \
+        submission_digest("ada", "ada@example.com", "hello there")
+    assert submission_digest("ada", "ada@example.com", "hello") != submission_digest("ada", "ada@example.com", "bye")
+
+
+def test_token_bucket_burst_and_refill():
+    bucket = TokenBucket(capacity=2, refill_seconds=10)
+    assert bucket.take("a", 0) == 0
+    assert bucket.take("a", 0) == 0
+    assert bucket.take("a", 0) == pytest.approx(10)
+    assert bucket.take("a", 5) == pytest.approx(5)
+    assert bucket.take("a", 10) == 0
+    # Other keys have their own bucket
+    assert bucket.take("b", 0) == 0
+
+
+def test_sliding_window_expires_old_events():
+    window = SlidingWindow(limit=2, window=100)
+    window.record("a", 0)
+    window.record("a", 30)
+    assert window.retry_after("a", 50) == pytest.approx(50)
+    # The first event leaves the window at 100, freeing a slot
+    assert window.retry_after("a", 100) == 0
+    assert window.retry_after("b", 50) == 0
+    window.prune(200)
+    assert len(window) == 0
+
+
+def test_duplicate_is_acknowledged_not_counted():
+    contact = guard()
+    assert contact.check("ip:1", *message(1), now=0).allowed
+    decision = contact.check("ip:1", " ADA ", "ada@example.com", "Message   number 1", now=1)
+    assert (decision.allowed, decision.reason) == (False, "duplicate")
+    # A duplicate does not use up the visitor's burst
+    assert contact.check("ip:1", *message(2), now=2).allowed
+    assert contact.check("ip:1", *message(3), now=3).allowed
+
+
+def test_duplicate_window_expires():
+    contact = guard(dedup_seconds=100)
+    assert contact.check("ip:1", *message(1), now=0).allowed
+    assert contact.check("ip:1", *message(1), now=100).allowed
+
+
+def test_burst_then_refill():
+    contact = guard(burst=2, refill_seconds=60)
+    assert contact.check("ip:1", *message(1), now=0).allowed
+    assert contact.check("ip:1", *message(2), now=0).allowed
+    decision = contact.check("ip:1", *message(3), now=0)
+    assert decision.reason == "rate_limited"
+    assert decision.retry_after == pytest.approx(60)
+    # Another visitor is unaffected
+    assert contact.check("ip:2", *message(3), now=0).allowed
+    assert contact.check("ip:1", *message(4), now=60).allowed
+
+
+def test_hourly_limit_per_client():
+    contact = guard(burst=10, refill_seconds=1, hourly_limit=3)
+    for n in range(3):
+        assert contact.check("ip:1", *message(n), now=n * 10).allowed
+    decision = contact.check("ip:1", *message(3), now=100)
+    assert decision.reason == "rate_limited"
+    assert decision.retry_after == pytest.approx(3500)
+    assert contact.check("ip:1", *message(3), now=3600).allowed
+
+
+def test_global_limit_covers_all_clients():
+    contact = guard(global_hourly_limit=2)
+    assert contact.check("ip:1", *message(1), now=0).allowed
+    assert contact.check("ip:2", *message(2), now=0).allowed
+    assert contact.check("ip:3", *message(3), now=0).reason == "rate_limited"
+
+
+def test_rejected_submission_consumes_nothing():
+    contact = guard(burst=1, global_hourly_limit=1)
+    assert contact.check("ip:1", *message(1), now=0).allowed
+    assert contact.check("ip:2", *message(2), now=10).reason == "rate_limited"
+    # ip:2's bucket was not drawn from while the global window refused it
+    assert contact.check("ip:2", *message(2), now=3600).allowed
+
+
+def test_forget_lets_a_failed_submission_be_retried():
+    contact = guard()
+    assert contact.check("ip:1", *message(1), now=0).allowed
+    contact.forget(*message(1))
+    assert contact.check("ip:1", *message(1), now=1).allowed
+    # Forgetting something never seen is harmless
+    contact.forget(*message(99))
+    assert contact.stats()["accepted"] == 1
+
+
+def test_stats():
+    contact = guard(burst=1)
+    contact.check("ip:1", *message(1), now=0)
+    contact.check("ip:1", *message(1), now=0)
+    contact.check("ip:1", *message(2), now=0)
+    assert contact.stats() == {"accepted": 1, "rate_limited": 1, "duplicates": 1, "tracked_clients": 1}
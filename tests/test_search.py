@@ -0,0 +1,73 @@
+from conftest import project_entry
+from search import SearchIndex, tokenize
+
+
+def test_tokenize_keeps_plus_and_hash():
+    assert tokenize("Built with C++, C# and Node.js!") == ["built", "with", "c++", "c#", "and", "node", "js"]
+    assert tokenize("") == []
+
+
+def index(make_content, *projects, **sections):
+    return SearchIndex(make_content(projects, **sections))
+
+
+def titles(results):
+    return [document.title for document in results]
+
+
+def test_words_match_as_prefixes(make_content):
+    search = index(make_content, project_entry("Knowledge Graph Explorer", ["Streamlit"])).search
+    assert titles(search("know")) == ["Knowledge Graph Explorer"]
+    assert titles(search("STREAM")) == ["Knowledge Graph Explorer"]
+    assert search("graphs") == []
+
+
+def test_every_word_must_match(make_content):
+    search = index(make_content,
+                   project_entry("Knowledge Graph Explorer", ["Python"]),
+                   project_entry("Sales Dashboard", ["Python", "Power BI"])).search
+    assert titles(search("python")) == ["Knowledge Graph Explorer", "Sales Dashboard"]
+    assert titles(search("python dash")) == ["Sales Dashboard"]
+    assert search("python missing") == []
+
+
+def test_blank_query_matches_nothing(make_content):
+    search = index(make_content, project_entry("Sales Dashboard")).search
+    assert search("") == []
+    assert search(" ,. ") == []
+
+
+def test_title_outranks_tag_outranks_text(make_content):
+    search = index(make_content,
+                   project_entry("Inventory Tracker", description="A dashboard for stock levels"),
+                   project_entry("Report Builder", ["Dashboard"]),
+                   project_entry("Dashboard Suite")).search
+    assert titles(search("dashboard")) == ["Dashboard Suite", "Report Builder", "Inventory Tracker"]
+
+
+def test_exact_word_outranks_prefix(make_content):
+    search = index(make_content,
+                   project_entry("Graphical Planner"),
+                   project_entry("Graph Explorer")).search
+    assert titles(search("graph")) == ["Graph Explorer", "Graphical Planner"]
+
+
+def test_symbols_are_searchable(make_content):
+    search = index(make_content,
+                   project_entry("Game Engine", ["C++"]),
+                   project_entry("Billing Service", ["C#"])).search
+    assert titles(search("c++")) == ["Game Engine"]
+    assert titles(search("C#")) == ["Billing Service"]
+
+
+def test_results_cover_other_sections_and_link_to_cards(make_content):
+    search = index(make_content, certifications=[{"title": "Cloud Practitioner", "issuer": "AWS",
+                                                  "date": "2024"}]).search
+    (result,) = search("aws")
+    assert (result.kind, result.title, result.summary) == ("Certification", "Cloud Practitioner", "AWS · 2024")
+    assert result.anchor
+
+
+def test_limit(make_content):
+    search = index(make_content, *(project_entry(f"Project {n}", ["Python"]) for n in range(5))).search
+    assert len(search("python", limit=3)) == 3
@@ -0,0 +1,50 @@
+from static_server import accepted_encodings, etag_matches
+
+AVAILABLE = ["br", "gzip"]
+
+
+def test_no_header_accepts_nothing():
+    assert accepted_encodings(None, AVAILABLE) == set()
+    assert accepted_encodings("", AVAILABLE) == set()
+
+
+def test_listed_codings_are_accepted_case_insensitively():
+    assert accepted_encodings("GZip, deflate", AVAILABLE) == {"gzip"}
+    assert accepted_encodings("br;q=0.5, gzip;q=1.0", AVAILABLE) == {"br", "gzip"}
+
+
+def test_q_zero_refuses_a_coding():
+    assert accepted_encodings("gzip;q=0, br", AVAILABLE) == {"br"}
+    assert accepted_encodings("gzip;q=0.0", AVAILABLE) == set()
+
+
+def test_wildcard_stands_for_unlisted_codings():
+    assert accepted_encodings("*", AVAILABLE) == {"br", "gzip"}
+    assert accepted_encodings("deflate, *", AVAILABLE) == {"br", "gzip"}
+
+
+def test_wildcard_does_not_override_an_explicit_q_zero():
+    assert accepted_encodings("gzip;q=0, *", AVAILABLE) == {"br"}
+    assert accepted_encodings("*, br;q=0, gzip;q=0", AVAILABLE) == set()
+
+
+def test_refused_wildcard_keeps_listed_codings():
+    assert accepted_encodings("*;q=0, gzip", AVAILABLE) == {"gzip"}
+    assert accepted_encodings("*;q=0", AVAILABLE) == set()
+
+
+def test_malformed_quality_counts_as_refused():
+    assert accepted_encodings("gzip;q=high, br", AVAILABLE) == {"br"}
+
+
+def test_only_available_codings_are_returned():
+    assert accepted_encodings("zstd, gzip", ["gzip"]) == {"gzip"}
+
+
+def test_etag_matches():
+    assert etag_matches('"abc"', '"abc"')
+    assert etag_matches('W/"abc"', '"abc"')
+    assert etag_matches('"x", "abc"', '"abc"')
+    assert etag_matches("*", '"abc"')
+    assert not etag_matches(None, '"abc"')
+    assert not etag_matches('"abcd"', '"abc"')
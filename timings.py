@@ -0,0 +1,106 @@
+"""Per-section render timings aggregated across sessions.
+
+Enable with PORTFOLIO_TIMINGS=1. Each page section decorated with @timed(name)
+then records its wall-clock render time into a bounded, process-wide sample
+window, summarised as p50/p95/p99. The summary is shown in the ?debug=1
+sidebar and logged as one JSON line every PORTFOLIO_TIMINGS_LOG_SECONDS (and
+written to PORTFOLIO_TIMINGS_FILE when that is set). When timings are disabled
+@timed returns the section function unchanged, so there is no overhead.
+"""
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+ENABLED = os.getenv("PORTFOLIO_TIMINGS", "0") == "1"
+MAX_SAMPLES = int(os.getenv("PORTFOLIO_TIMINGS_SAMPLES", "1000"))
+LOG_SECONDS = float(os.getenv("PORTFOLIO_TIMINGS_LOG_SECONDS", "60"))
+TIMINGS_FILE = os.getenv("PORTFOLIO_TIMINGS_FILE")
+
+
+# Function to read a percentile from sorted samples
+def percentile(sorted_samples, fraction):
+    """Return the nearest-rank percentile of an already sorted list"""
+    if not sorted_samples:
+        return 0.0
+    rank = max(1, round(fraction * len(sorted_samples)))
+    return sorted_samples[min(rank, len(sorted_samples)) - 1]
+
+
+class SectionTimings:
+    """Sliding windows of render times per section, shared by every session"""
+
+    def __init__(self, max_samples=MAX_SAMPLES, log_seconds=LOG_SECONDS, timings_file=TIMINGS_FILE):
+        self.max_samples = max_samples
+        self.log_seconds = log_seconds
+        self.timings_file = timings_file
+        self._samples = {}
+        self._counts = {}
+        self._lock = threading.Lock()
+        self._last_report = time.monotonic()
+
+    def record(self, section, seconds):
+        """Add one render time for a section"""
+        with self._lock:
+            samples = self._samples.get(section)
+            if samples is None:
+                samples = self._samples[section] = deque(maxlen=self.max_samples)
+            samples.append(seconds)
+            self._counts[section] = self._counts.get(section, 0) + 1
+            due = time.monotonic() - self._last_report >= self.log_seconds
+            if due:
+                self._last_report = time.monotonic()
+        if due:
+            self.report()
+
+    def stats(self):
+        """Return {section: count and p50/p95/p99/max in milliseconds} over the current window"""
+        with self._lock:
+            windows = {section: sorted(samples) for section, samples in self._samples.items()}
+            counts = dict(self._counts)
+        return {
+            section: {
+                "count": counts[section],
+                "p50_ms": percentile(samples, 0.50) * 1000,
+                "p95_ms": percentile(samples, 0.95) * 1000,
+                "p99_ms": percentile(samples, 0.99) * 1000,
+                "max_ms": samples[-1] * 1000,
+            }
+            for section, samples in windows.items()
+        }
+
+    def report(self):
+        """Log the current stats as one JSON line and write them to the timings file, if configured"""
+        payload = json.dumps({"timestamp": time.time(), "sections": self.stats()})
+        logger.info("section timings %s", payload)
+        if self.timings_file:
+            tmp_path = f"{self.timings_file}.tmp"
+            with open(tmp_path, "w") as f:
+                f.write(payload)
+            os.replace(tmp_path, self.timings_file)
+
+
+section_timings = SectionTimings()
+
+
+# Decorator to time a page section
+def timed(section):
+    """Record each call's duration under `section`; a no-op unless PORTFOLIO_TIMINGS=1"""
+    def decorate(func):
+        if not ENABLED:
+            return func
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                section_timings.record(section, time.perf_counter() - started)
+        return wrapper
+    return decorate
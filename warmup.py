@@ -0,0 +1,154 @@
+"""One-time startup phase that warms the process-wide caches.
+
+The warm-up runs once per process in a background thread. It checks that
+every image the page uses exists (and that its build_assets.py variants are
+present), scales and encodes the images the page renders server-side into the shared
+image cache, encodes placeholders for the missing ones, compiles every theme's stylesheet, renders every HTML card
+and builds the search index.
+Missing assets are logged at boot rather than discovered per request.
+
+Streamlit only executes app.py when the first browser session connects, so
+serve.py starts the warm-up before the server accepts connections; app.py
+also starts it, which is a no-op once it has run.
+"""
+import logging
+import os
+import threading
+import time
+
+import fragments
+import search
+import styles
+from assets import (ASSET_BASE_URL, IMAGES_DIR, VARIANTS_DIR, column_width, image_cache, image_path, placeholder_png,
+                    variant_manifest)
+from content import load_content, page_images
+
+logger = logging.getLogger(__name__)
+
+# File touched once the warm-up finished, for container readiness probes
+READY_FILE = os.getenv("PORTFOLIO_READY_FILE")
+
+# Function to check the images against the variant manifest
+def verify_assets(content):
+    """Return the missing source images and the variant files the manifest lists but which are gone"""
+    missing, missing_variants = [], []
+    for relative_path, _, _, _, _ in page_images(content):
+        if not (IMAGES_DIR / relative_path).is_file():
+            missing.append(relative_path)
+            continue
+        for variant in variant_manifest.variants(relative_path, formats=("avif", "webp")):
+            if not (VARIANTS_DIR / variant["file"]).is_file():
+                missing_variants.append(variant["file"])
+    return missing, missing_variants
+
+
+class Warmup(threading.Thread):
+    """Background thread that warms the caches once and then signals readiness"""
+
+    def __init__(self):
+        super().__init__(name="portfolio-warmup", daemon=True)
+        self._ready = threading.Event()
+        self._report = {"ready": False}
+
+    def run(self):
+        started = time.monotonic()
+        report = {"ready": False, "errors": []}
+        try:
+            content = load_content()
+            report["content_version"] = content.version
+
+            missing, missing_variants = verify_assets(content)
+            report["missing_images"] = missing
+            report["missing_variants"] = missing_variants
+            if missing:
+                logger.warning("Missing images (placeholders will be shown): %s", ", ".join(missing))
+            if missing_variants:
+                logger.warning("Variant files listed in the manifest are missing; re-run build_assets.py: %s",
+                               ", ".join(missing_variants))
+
+            report["images_decoded"] = self._decode_images(content, missing, report["errors"])
+
+            styles.common_stylesheet()
+            for theme in styles.THEME_COLORS:
+                styles.theme_stylesheet(theme)
+                styles.portfolio_stylesheet(theme)
+            report["stylesheets"] = 1 + 2 * len(styles.THEME_COLORS)
+
+            report["fragments"] = fragments.prerender(content)
+            report["search_terms"] = len(search.index_for(content).vocabulary)
+        except Exception as exc:
+            # A failed warm-up only means colder caches; the app still serves
+            logger.exception("Warm-up failed")
+            report["errors"].append(str(exc))
+
+        report["duration_s"] = time.monotonic() - started
+        report["ready"] = True
+        self._report = report
+        if READY_FILE:
+            with open(READY_FILE, "w") as f:
+                f.write(f"{report['duration_s']:.3f}\n")
+        logger.info("Warm-up finished in %.2fs", report["duration_s"])
+        self._ready.set()
+
+    def _decode_images(self, content, missing, errors):
+        """Encode the display-sized images the page renders through st.image, and the placeholders for missing ones"""
+        decoded = 0
+        for relative_path, _, fraction, _, placeholder in page_images(content):
+            if relative_path in missing:
+                try:
+                    placeholder_png(*placeholder)
+                except Exception as exc:
+                    errors.append(f"placeholder for {relative_path}: {exc}")
+                continue
+            # Images the browser loads by URL are never decoded by the server
+            if ASSET_BASE_URL or variant_manifest.variants(relative_path, formats=("avif", "webp")):
+                continue
+            try:
+                width = column_width(fraction)
+                if image_cache.get(image_path(relative_path, width), width) is not None:
+                    decoded += 1
+            except Exception as exc:
+                errors.append(f"{relative_path}: {exc}")
+        return decoded
+
+    def wait(self, timeout=None):
+        """Block until the warm-up has finished; return whether it has"""
+        return self._ready.wait(timeout)
+
+    def is_ready(self):
+        return self._ready.is_set()
+
+    def report(self):
+        """Return what the warm-up found and how long it took"""
+        return dict(self._report)
+
+
+_warmup = None
+_warmup_lock = threading.Lock()
+
+
+# Function to start the warm-up
+def start():
+    """Start the warm-up if this process has not run it yet, and return it"""
+    global _warmup
+    with _warmup_lock:
+        if _warmup is None:
+            _warmup = Warmup()
+            _warmup.start()
+        return _warmup
+
+
+# Function to check readiness
+def is_ready():
+    """Return True once the warm-up has finished"""
+    with _warmup_lock:
+        warmup = _warmup
+    return warmup is not None and warmup.is_ready()
+
+
+# Function to report the warm-up result
+def report():
+    """Return the warm-up report, or None if it has not been started"""
+    with _warmup_lock:
+        warmup = _warmup
+    return warmup.report() if warmup is not None else None